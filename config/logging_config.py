@@ -1,9 +1,35 @@
 """Logging configuration."""
 import sys
+from functools import lru_cache
 from loguru import logger
 from config.settings import get_settings
 
 
+class SizeAndTimeRotator:
+    """Rotate the log file when it grows past a size cap or the day changes."""
+
+    def __init__(self, size_limit: int = 100 * 1024 * 1024):
+        """
+        Initialize rotator.
+
+        Args:
+            size_limit: Maximum file size in bytes before rotation
+        """
+        self._size_limit = size_limit
+        self._last_date = None
+
+    def __call__(self, message, file) -> bool:
+        """Return True when the current file should be rotated."""
+        date = message.record["time"].date()
+        if self._last_date is None:
+            self._last_date = date
+        elif date != self._last_date:
+            self._last_date = date
+            return True
+        return file.tell() + len(message) > self._size_limit
+
+
+@lru_cache(maxsize=1)
 def setup_logging():
     """Configure application logging."""
     settings = get_settings()
@@ -19,14 +45,18 @@ def setup_logging():
         colorize=True,
     )
 
-    # Add file handler
+    # Add file handler; rotate at midnight and on a size cap so a
+    # traffic spike cannot grow a single day's file unbounded. The
+    # template stays date-only so restarts within a day append to the
+    # same file; loguru renames on rotation collisions.
     logger.add(
         "logs/app_{time:YYYY-MM-DD}.log",
         level=settings.log_level,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} - {message}",
-        rotation="00:00",
+        rotation=SizeAndTimeRotator(),
         retention="30 days",
         compression="zip",
+        enqueue=True,
     )
 
     return logger
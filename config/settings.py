@@ -1,19 +1,26 @@
 """Application configuration settings."""
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import MISSING, dataclass, field, fields
 from functools import lru_cache
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
-    # Groq API Configuration
+    # Required credentials
     groq_api_key: str
+    telegram_bot_token: str
+
+    # Groq API Configuration
     groq_model: str = "llama-3.3-70b-versatile"
     groq_temperature: float = 0.7
     groq_max_tokens: int = 2048
 
     # Telegram Bot Configuration
-    telegram_bot_token: str
+    thread_pool_size: int = 64
 
     # Application Paths
     log_level: str = "INFO"
@@ -25,17 +32,34 @@ class Settings(BaseSettings):
     default_platforms: str = "tiktok,instagram,youtube"
     default_aspect_ratio: str = "9:16"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Derived from default_platforms, computed once at construction
+    platforms_list: tuple[str, ...] = field(init=False)
 
-    @property
-    def platforms_list(self) -> list[str]:
-        """Return platforms as a list."""
-        return [p.strip() for p in self.default_platforms.split(",")]
+    def __post_init__(self):
+        """Precompute derived fields (frozen + slots, so set via object)."""
+        object.__setattr__(
+            self,
+            "platforms_list",
+            tuple(p.strip() for p in self.default_platforms.split(",")),
+        )
 
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get cached settings instance built from .env / environment variables."""
+    load_dotenv()
+
+    kwargs = {}
+    for f in fields(Settings):
+        if not f.init:
+            continue
+        raw = os.environ.get(f.name.upper())
+        if raw is None:
+            if f.default is MISSING:
+                raise RuntimeError(
+                    f"Missing required environment variable: {f.name.upper()}"
+                )
+            continue
+        kwargs[f.name] = f.type(raw)
+
+    return Settings(**kwargs)
@@ -1,6 +1,8 @@
 """Telegram Bot for RekaKata."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import aiofiles
 from telegram import Update
 from telegram.ext import (
     Application,
@@ -9,11 +11,65 @@ from telegram.ext import (
     filters,
     ContextTypes,
 )
+from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 from src.core.prompt_engine import PromptEngine
 from config.logging_config import log
 from config.settings import get_settings
 
 
+WELCOME_MESSAGE = """
+🎬 *RekaKata - UGC Prompt Generator*
+
+Selamat datang! Saya akan membantu kamu membuat prompt text-to-video yang berkualitas tinggi.
+
+*Perintah yang tersedia:*
+• `/generate <ide>` - Buat prompt baru
+• `/export` - Download prompt terakhir sebagai file .md
+• `/help` - Lihat bantuan
+
+*Contoh penggunaan:*
+/generate Jualin skincare pagi hari yang bagus buat wajah berminyak
+
+Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
+"""
+
+HELP_MESSAGE = """
+🎬 *RekaKata - Bantuan*
+
+*Perintah:*
+
+`/start` - Mulai bot dan lihat pesan selamat datang
+
+`/generate <ide>` - Buat prompt baru
+  Contoh: /generate Jualin skincare pagi hari
+
+`/export` - Download prompt terakhir sebagai file .md
+
+`/help` - Lihat pesan bantuan ini
+
+*Tips:*
+• Kamu juga bisa langsung mengetik ide tanpa perintah
+• Semakin spesifik ide kamu, semakin bagus promptnya
+• Gunakan bahasa Indonesia atau Inggris
+
+*Platform yang didukung:*
+• TikTok
+• Instagram Reels
+• YouTube Shorts
+
+Butuh bantuan lainnya? Hubungi admin! 🆘
+"""
+
+# Shared reply kwargs, built once instead of per call
+_MD_KW = {"parse_mode": ParseMode.MARKDOWN}
+_MD_NOPREV = {**_MD_KW, "disable_web_page_preview": True}
+
+# Idle chat workers reap themselves after this many seconds so the
+# per-chat queue/task maps do not grow with every chat id ever seen
+_WORKER_IDLE_TIMEOUT = 300.0
+
+
 class TelegramBot:
     """Telegram bot interface for RekaKata."""
 
@@ -21,9 +77,15 @@ class TelegramBot:
         """Initialize Telegram bot."""
         self.settings = get_settings()
         self.engine = PromptEngine()
-        self.application = Application.builder().token(
-            self.settings.telegram_bot_token
-        ).build()
+        self.application = (
+            Application.builder()
+            .token(self.settings.telegram_bot_token)
+            .concurrent_updates(True)
+            .request(HTTPXRequest(connection_pool_size=100))
+            .get_updates_request(HTTPXRequest(connection_pool_size=10))
+            .post_shutdown(self._on_shutdown)
+            .build()
+        )
 
         # Register handlers
         self.application.add_handler(CommandHandler("start", self.start_command))
@@ -36,8 +98,71 @@ class TelegramBot:
             MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text)
         )
 
+        # Per-chat work queues: serialize messages within a chat while
+        # letting unrelated chats generate concurrently
+        self._chat_queues: dict[int, asyncio.Queue] = {}
+        self._chat_workers: dict[int, asyncio.Task] = {}
+
         log.info("TelegramBot initialized")
 
+    async def _on_shutdown(self, application: Application) -> None:
+        """Cancel chat workers and release pooled HTTP connections."""
+        for task in self._chat_workers.values():
+            task.cancel()
+        if self._chat_workers:
+            await asyncio.gather(
+                *self._chat_workers.values(), return_exceptions=True
+            )
+        self._chat_workers.clear()
+        self._chat_queues.clear()
+        await self.engine.aclose()
+
+    def _enqueue_work(self, chat_id: int, item: tuple) -> None:
+        """
+        Queue a work item for a chat, spawning its worker if needed.
+
+        Args:
+            chat_id: Telegram chat identifier
+            item: Tuple of (update, user_input, kind)
+        """
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._chat_queues[chat_id] = queue
+            self._chat_workers[chat_id] = asyncio.create_task(
+                self._chat_worker(chat_id, queue)
+            )
+        queue.put_nowait(item)
+
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue) -> None:
+        """
+        Process a single chat's work items in arrival order.
+
+        Args:
+            chat_id: Telegram chat identifier
+            queue: Work queue for this chat
+        """
+        while True:
+            try:
+                update, user_input, kind = await asyncio.wait_for(
+                    queue.get(), timeout=_WORKER_IDLE_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                # An item may have arrived between the timeout firing and
+                # this coroutine resuming; only reap when truly idle
+                if queue.empty():
+                    self._chat_queues.pop(chat_id, None)
+                    self._chat_workers.pop(chat_id, None)
+                    log.debug(f"Reaped idle worker for chat {chat_id}")
+                    return
+                continue
+            try:
+                await self._process_idea(update, user_input, debug=(kind == "debug"))
+            except Exception as e:
+                log.opt(exception=True).error("Error in worker for chat {}: {}", chat_id, e)
+            finally:
+                queue.task_done()
+
     async def ping_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -54,23 +179,7 @@ class TelegramBot:
             update: Telegram update
             context: Bot context
         """
-        welcome_message = """
-🎬 *RekaKata - UGC Prompt Generator*
-
-Selamat datang! Saya akan membantu kamu membuat prompt text-to-video yang berkualitas tinggi.
-
-*Perintah yang tersedia:*
-• `/generate <ide>` - Buat prompt baru
-• `/export` - Download prompt terakhir sebagai file .md
-• `/help` - Lihat bantuan
-
-*Contoh penggunaan:*
-/generate Jualin skincare pagi hari yang bagus buat wajah berminyak
-
-Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
-"""
-
-        await update.message.reply_text(welcome_message, parse_mode="Markdown")
+        await update.message.reply_text(WELCOME_MESSAGE, **_MD_KW)
         log.info(f"User {update.effective_user.id} started the bot")
 
     async def generate_command(
@@ -87,40 +196,12 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
         if not context.args:
             await update.message.reply_text(
                 "⚠️ Mohon masukkan ide konten kamu!\n\nContoh: /generate Jualin skincare pagi hari",
-                parse_mode="Markdown",
+                **_MD_KW,
             )
             return
 
         user_input = " ".join(context.args)
-
-        # Send processing message
-        processing_msg = await update.message.reply_text("⏳ Sedang memproses...")
-
-        try:
-            # Generate prompt in background thread
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(None, self.engine.generate_prompt, user_input)
-
-            if not result["success"]:
-                await processing_msg.delete()
-                await update.message.reply_text(
-                    f"❌ *Error:* {result.get('error', 'Unknown error')}",
-                    parse_mode="Markdown",
-                )
-                return
-
-            # Delete processing message
-            await processing_msg.delete()
-
-            # Send result
-            await self._send_prompt_result(update, result)
-
-        except Exception as e:
-            await processing_msg.delete()
-            await update.message.reply_text(
-                f"❌ *Terjadi kesalahan:* {str(e)}", parse_mode="Markdown"
-            )
-            log.error(f"Error in generate command: {e}", exc_info=True)
+        self._enqueue_work(update.effective_chat.id, (update, user_input, "generate"))
 
     async def handle_text(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -133,20 +214,31 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
             context: Bot context
         """
         user_input = update.message.text
+        self._enqueue_work(update.effective_chat.id, (update, user_input, "generate"))
 
+    async def _process_idea(self, update: Update, user_input: str, debug: bool = False) -> None:
+        """
+        Generate a prompt and reply with the formatted (or raw) result.
+
+        Args:
+            update: Telegram update
+            user_input: User's content idea
+            debug: Reply with the raw AI response instead of the formatted one
+        """
         # Send processing message
-        processing_msg = await update.message.reply_text("⏳ Sedang memproses...")
+        processing_msg = await update.message.reply_text(
+            "🐞 DEBUG MODE: Memproses..." if debug else "⏳ Sedang memproses..."
+        )
 
         try:
-            # Generate prompt in background thread
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(None, self.engine.generate_prompt, user_input)
+            # Generate prompt without blocking the event loop
+            result = await self.engine.agenerate_prompt(user_input)
 
             if not result["success"]:
                 await processing_msg.delete()
                 await update.message.reply_text(
                     f"❌ *Error:* {result.get('error', 'Unknown error')}",
-                    parse_mode="Markdown",
+                    **_MD_KW,
                 )
                 return
 
@@ -154,14 +246,40 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
             await processing_msg.delete()
 
             # Send result
-            await self._send_prompt_result(update, result)
+            if debug:
+                await self._send_raw_response(update, result)
+            else:
+                await self._send_prompt_result(update, result)
 
         except Exception as e:
             await processing_msg.delete()
             await update.message.reply_text(
-                f"❌ *Terjadi kesalahan:* {str(e)}", parse_mode="Markdown"
+                f"❌ *Terjadi kesalahan:* {str(e)}", **_MD_KW
             )
-            log.error(f"Error in handle_text: {e}", exc_info=True)
+            log.opt(exception=True).error("Error processing idea: {}", e)
+
+    async def _send_raw_response(self, update: Update, result: dict) -> None:
+        """
+        Send the raw AI response as a code block for /debug.
+
+        Args:
+            update: Telegram update
+            result: Generated prompt result
+        """
+        structured = result.get("structured_result", {})
+        raw_response = structured.get("raw_response", "No raw response found")
+
+        # Split if too long (Telegram limit 4096)
+        if len(raw_response) > 4000:
+            raw_response = raw_response[:4000] + "... (truncated)"
+
+        stats = self.engine.cache_stats()
+        await update.message.reply_text(
+            f"🐞 **RAW AI RESPONSE**:\n\n```\n{raw_response}\n```\n\n"
+            f"📊 Cache: {stats['hits']} hits / {stats['misses']} misses, "
+            f"{stats['size']}/{stats['maxsize']} entries",
+            **_MD_KW,
+        )
 
     async def _send_prompt_result(
         self, update: Update, result: dict
@@ -177,13 +295,13 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
 
         # Send main output
         await update.message.reply_text(
-            telegram_output, parse_mode="Markdown", disable_web_page_preview=True
+            telegram_output, **_MD_NOPREV
         )
 
         # Send file download hint
         await update.message.reply_text(
             "📁 Ketik `/export` untuk download file .md",
-            parse_mode="Markdown",
+            **_MD_KW,
         )
 
     async def export_command(
@@ -207,14 +325,16 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
                 await update.message.reply_text(
                     "⚠️ Tidak ada prompt yang tersedia untuk diekspor. "
                     "Buat prompt dulu dengan /generate",
-                    parse_mode="Markdown",
+                    **_MD_KW,
                 )
                 return
 
-            # Send file
+            # Send file (read asynchronously so the event loop is not blocked)
             file_path = Path(filepath)
+            async with aiofiles.open(file_path, "rb") as f:
+                document = await f.read()
             await update.message.reply_document(
-                document=open(file_path, "rb"),
+                document=document,
                 filename=file_path.name,
                 caption=f"📄 {file_path.name}",
             )
@@ -225,9 +345,9 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
         except Exception as e:
             await processing_msg.delete()
             await update.message.reply_text(
-                f"❌ *Gagal mengekspor:* {str(e)}", parse_mode="Markdown"
+                f"❌ *Gagal mengekspor:* {str(e)}", **_MD_KW
             )
-            log.error(f"Error in export command: {e}", exc_info=True)
+            log.opt(exception=True).error("Error in export command: {}", e)
 
     async def debug_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -240,42 +360,11 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
             context: Bot context
         """
         if not context.args:
-            await update.message.reply_text("⚠️ Masukkan ide untuk debug!", parse_mode="Markdown")
+            await update.message.reply_text("⚠️ Masukkan ide untuk debug!", **_MD_KW)
             return
 
         user_input = " ".join(context.args)
-        processing_msg = await update.message.reply_text("🐞 DEBUG MODE: Memproses...")
-
-        try:
-            # Generate prompt in background thread
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(None, self.engine.generate_prompt, user_input)
-
-            if not result["success"]:
-                await processing_msg.delete()
-                await update.message.reply_text(f"❌ Error: {result.get('error')}")
-                return
-
-            await processing_msg.delete()
-
-            # Extract raw response
-            structured = result.get("structured_result", {})
-            raw_response = structured.get("raw_response", "No raw response found")
-
-            # Send raw response as code block
-            # Split if too long (Telegram limit 4096)
-            if len(raw_response) > 4000:
-                raw_response = raw_response[:4000] + "... (truncated)"
-
-            await update.message.reply_text(
-                f"🐞 **RAW AI RESPONSE**:\n\n```\n{raw_response}\n```",
-                parse_mode="Markdown"
-            )
-
-        except Exception as e:
-            await processing_msg.delete()
-            await update.message.reply_text(f"❌ Exception: {str(e)}")
-            log.error(f"Error in debug command: {e}", exc_info=True)
+        self._enqueue_work(update.effective_chat.id, (update, user_input, "debug"))
 
     async def help_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -287,38 +376,20 @@ Atau ketik langsung ide kamu, dan saya akan bantu buatkan promptnya! ✨
             update: Telegram update
             context: Bot context
         """
-        help_message = """
-🎬 *RekaKata - Bantuan*
-
-*Perintah:*
-
-`/start` - Mulai bot dan lihat pesan selamat datang
-
-`/generate <ide>` - Buat prompt baru
-  Contoh: /generate Jualin skincare pagi hari
-
-`/export` - Download prompt terakhir sebagai file .md
-
-`/help` - Lihat pesan bantuan ini
-
-*Tips:*
-• Kamu juga bisa langsung mengetik ide tanpa perintah
-• Semakin spesifik ide kamu, semakin bagus promptnya
-• Gunakan bahasa Indonesia atau Inggris
-
-*Platform yang didukung:*
-• TikTok
-• Instagram Reels
-• YouTube Shorts
-
-Butuh bantuan lainnya? Hubungi admin! 🆘
-"""
-
-        await update.message.reply_text(help_message, parse_mode="Markdown")
+        await update.message.reply_text(HELP_MESSAGE, **_MD_KW)
 
     def run(self):
         """Start the bot."""
         log.info("Starting Telegram bot...")
+
+        # Widen the default executor so blocking work dispatched to threads
+        # is not capped at asyncio's default of ~32 workers
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=self.settings.thread_pool_size)
+        )
+
         self.application.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
@@ -1,19 +1,26 @@
 """CLI interface for RekaKata."""
 import click
 import sys
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
-
-from src.core.prompt_engine import PromptEngine
-from config.logging_config import log
 
+# Heavy imports (prompt engine, Groq client, logging setup) are deferred
+# into the commands that need them so lightweight commands like
+# `version` and `info` start without paying for them.
 
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _get_engine():
+    """Get cached PromptEngine instance shared across CLI commands."""
+    from src.core.prompt_engine import PromptEngine
+
+    return PromptEngine()
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -42,6 +49,9 @@ def generate(idea: str, output: str, format: str, platforms: str):
 
     IDEA: Your content idea or description
     """
+    from rich.markdown import Markdown
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         # Parse platforms if provided
         platform_list = None
@@ -58,7 +68,7 @@ def generate(idea: str, output: str, format: str, platforms: str):
             task = progress.add_task("[cyan]Generating prompt...", total=None)
 
             # Generate prompt
-            engine = PromptEngine()
+            engine = _get_engine()
             result = engine.generate_prompt(idea, platforms=platform_list)
 
             progress.remove_task(task)
@@ -130,7 +140,9 @@ def generate(idea: str, output: str, format: str, platforms: str):
                 border_style="red",
             )
         )
-        log.error(f"CLI error: {e}", exc_info=True)
+        from config.logging_config import log
+
+        log.opt(exception=True).error("CLI error: {}", e)
         sys.exit(1)
 
 
@@ -138,7 +150,7 @@ def generate(idea: str, output: str, format: str, platforms: str):
 def export():
     """Export the last generated prompt to file."""
     try:
-        engine = PromptEngine()
+        engine = _get_engine()
 
         # Try to export
         filepath = engine.export_last_generated(format="md")
@@ -1,16 +1,23 @@
-"""Core module package."""
-from .input_validator import InputValidator
-from .trending_injector import TrendingInjector
-from .groq_client import GroqClient
-from .platform_optimizer import PlatformOptimizer
-from .output_formatter import OutputFormatter
-from .prompt_engine import PromptEngine
+"""Core module package with lazy submodule loading (PEP 562)."""
+import importlib
 
-__all__ = [
-    "InputValidator",
-    "TrendingInjector",
-    "GroqClient",
-    "PlatformOptimizer",
-    "OutputFormatter",
-    "PromptEngine",
-]
+_LAZY_IMPORTS = {
+    "InputValidator": "input_validator",
+    "TrendingInjector": "trending_injector",
+    "GroqClient": "groq_client",
+    "get_groq_client": "groq_client",
+    "PlatformOptimizer": "platform_optimizer",
+    "OutputFormatter": "output_formatter",
+    "PromptEngine": "prompt_engine",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import core classes on first access instead of at package import."""
+    try:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(module, name)
@@ -1,33 +1,119 @@
 """Groq API client for Llama 3.3 70B integration."""
-from typing import Dict, List, Optional
-from groq import Groq
-from tenacity import retry, stop_after_attempt, wait_exponential
+import asyncio
+import atexit
+import random
+import time
+from functools import lru_cache
+from io import StringIO
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+import httpx
+import groq
+from groq import Groq, AsyncGroq
+from src.core.llm_cache import CacheBackend, MemoryCache, make_key
 from config.settings import get_settings
 from config.logging_config import log
 
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# Generous read budget for long completions, but fail fast when the
+# endpoint is unreachable instead of burning a full minute on connect
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Only transient failures are worth retrying: transport errors, 429s and
+# 5xx responses. Other 4xx errors fail immediately.
+_RETRYABLE_ERRORS = (
+    groq.APIConnectionError,
+    groq.RateLimitError,
+    groq.InternalServerError,
+)
+
+
+def _backoff_delay(attempt: int, base: float = 2, cap: float = 10) -> float:
+    """Exponential backoff with a small jitter, capped at `cap` seconds."""
+    return min(cap, base * (2 ** attempt)) + random.random() * 0.3
+
+
+def _with_backoff(fn, *args, retries: int = 3, **kwargs):
+    """Call fn, retrying transient Groq errors with exponential backoff."""
+    for attempt in range(retries):
+        try:
+            return fn(*args, **kwargs)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == retries - 1:
+                raise
+            delay = _backoff_delay(attempt)
+            log.warning(f"Groq call failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+async def _awith_backoff(fn, *args, retries: int = 3, **kwargs):
+    """Async twin of _with_backoff using asyncio.sleep."""
+    for attempt in range(retries):
+        try:
+            return await fn(*args, **kwargs)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == retries - 1:
+                raise
+            delay = _backoff_delay(attempt)
+            log.warning(f"Groq call failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
 
 class GroqClient:
     """Groq API client wrapper for Llama 3.3 70B."""
 
-    def __init__(self):
-        """Initialize Groq client."""
+    def __init__(
+        self,
+        cache: Optional[CacheBackend] = None,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize Groq client.
+
+        Args:
+            cache: Response cache backend (default: in-process LRU)
+            http_client: Preconfigured sync transport (default: pooled)
+            async_http_client: Preconfigured async transport (default: pooled)
+        """
         settings = get_settings()
-        self.client = Groq(api_key=settings.groq_api_key)
+
+        # Shared pooled transports so all requests reuse warm TCP+TLS
+        # connections instead of handshaking per call; callers with their
+        # own tuned pools can inject them instead
+        self._http = http_client or httpx.Client(
+            timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS
+        )
+        self._async_http = async_http_client or httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS
+        )
+
+        self.client = Groq(api_key=settings.groq_api_key, http_client=self._http)
+        self.async_client = AsyncGroq(
+            api_key=settings.groq_api_key, http_client=self._async_http
+        )
         self.model = settings.groq_model
         self.temperature = settings.groq_temperature
         self.max_tokens = settings.groq_max_tokens
+        self.cache = cache if cache is not None else MemoryCache()
+
+        # Pre-bound call targets skip two attribute lookups per request
+        self._create = self.client.chat.completions.create
+        self._acreate = self.async_client.chat.completions.create
+
         log.info(f"GroqClient initialized with model: {self.model}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    async def aclose(self) -> None:
+        """Close the pooled HTTP transports."""
+        self._http.close()
+        await self._async_http.aclose()
+
     def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        force_cache: bool = False,
     ) -> str:
         """
         Generate text using Groq API.
@@ -37,6 +123,72 @@ class GroqClient:
             system_prompt: System prompt for context
             temperature: Temperature for generation (overrides default)
             max_tokens: Maximum tokens to generate (overrides default)
+            force_cache: Cache even at non-deterministic temperatures
+
+        Returns:
+            Generated text as string
+
+        Raises:
+            Exception: If API call fails after retries
+        """
+        messages = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+
+        # `is None` checks, not `or`: a caller-provided 0.0 is a valid
+        # temperature and must not fall back to the default
+        temp = self.temperature if temperature is None else temperature
+        tokens = self.max_tokens if max_tokens is None else max_tokens
+
+        # Only deterministic sampling (or an explicit opt-in) is cached:
+        # at temp > 0 callers expect fresh completions, and pipeline-level
+        # deduplication is already handled by the engine's result cache
+        use_cache = force_cache or temp <= 0
+        key = make_key(self.model, messages, temp, tokens) if use_cache else None
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = _with_backoff(
+                self._create,
+                model=self.model,
+                messages=messages,
+                temperature=temp,
+                max_tokens=tokens,
+            )
+
+            result = response.choices[0].message.content
+            if use_cache:
+                self.cache.set(key, result)
+            log.info(f"Generated response ({len(result)} characters)")
+            return result
+
+        except Exception as e:
+            log.error(f"Groq API error: {e}")
+            raise
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        force_cache: bool = False,
+    ) -> str:
+        """
+        Generate text using Groq API without blocking the event loop.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt for context
+            temperature: Temperature for generation (overrides default)
+            max_tokens: Maximum tokens to generate (overrides default)
+            force_cache: Cache even at non-deterministic temperatures
 
         Returns:
             Generated text as string
@@ -51,15 +203,33 @@ class GroqClient:
 
         messages.append({"role": "user", "content": prompt})
 
+        # `is None` checks, not `or`: a caller-provided 0.0 is a valid
+        # temperature and must not fall back to the default
+        temp = self.temperature if temperature is None else temperature
+        tokens = self.max_tokens if max_tokens is None else max_tokens
+
+        # Only deterministic sampling (or an explicit opt-in) is cached:
+        # at temp > 0 callers expect fresh completions, and pipeline-level
+        # deduplication is already handled by the engine's result cache
+        use_cache = force_cache or temp <= 0
+        key = make_key(self.model, messages, temp, tokens) if use_cache else None
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
-            response = self.client.chat.completions.create(
+            response = await _awith_backoff(
+                self._acreate,
                 model=self.model,
                 messages=messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                temperature=temp,
+                max_tokens=tokens,
             )
 
             result = response.choices[0].message.content
+            if use_cache:
+                self.cache.set(key, result)
             log.info(f"Generated response ({len(result)} characters)")
             return result
 
@@ -67,6 +237,138 @@ class GroqClient:
             log.error(f"Groq API error: {e}")
             raise
 
+    def _create_stream(self, messages: List[Dict], temperature: float, max_tokens: int):
+        """Open a streaming chat completion (retried on transient errors)."""
+        return _with_backoff(
+            self._create,
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+    async def _acreate_stream(
+        self, messages: List[Dict], temperature: float, max_tokens: int
+    ):
+        """Async twin of _create_stream."""
+        return await _awith_backoff(
+            self._acreate,
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Generate text using Groq API, yielding chunks as they arrive.
+
+        Streaming makes time-to-first-token the visible latency instead
+        of total generation time, so consumers can render progressively.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt for context
+            temperature: Temperature for generation (overrides default)
+            max_tokens: Maximum tokens to generate (overrides default)
+
+        Yields:
+            Generated text chunks
+        """
+        messages = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+
+        stream = self._create_stream(
+            messages,
+            self.temperature if temperature is None else temperature,
+            self.max_tokens if max_tokens is None else max_tokens,
+        )
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    async def agenerate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of generate_stream for asyncio consumers.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt for context
+            temperature: Temperature for generation (overrides default)
+            max_tokens: Maximum tokens to generate (overrides default)
+
+        Yields:
+            Generated text chunks
+        """
+        messages = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+
+        stream = await self._acreate_stream(
+            messages,
+            self.temperature if temperature is None else temperature,
+            self.max_tokens if max_tokens is None else max_tokens,
+        )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    async def agenerate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate completions for several prompts concurrently.
+
+        Args:
+            prompts: List of user prompts
+            system_prompt: Shared system prompt for context
+            temperature: Temperature for generation (overrides default)
+            max_tokens: Maximum tokens to generate (overrides default)
+
+        Returns:
+            Generated texts in the same order as prompts
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.agenerate(
+                        prompt=p,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    for p in prompts
+                )
+            )
+        )
+
     def generate_prompt_from_input(
         self,
         user_input: str,
@@ -74,6 +376,7 @@ class GroqClient:
         language: str,
         trending_elements: Dict,
         platform_specifics: Optional[Dict] = None,
+        sink: Optional[Callable[[str], None]] = None,
     ) -> Dict:
         """
         Generate a complete prompt for text-to-video generation.
@@ -84,6 +387,7 @@ class GroqClient:
             language: Input language
             trending_elements: Trending elements to inject
             platform_specifics: Platform-specific optimizations
+            sink: Optional callback receiving chunks as they stream in
 
         Returns:
             Dictionary containing all prompt components
@@ -94,22 +398,92 @@ class GroqClient:
             user_input, entities, trending_elements, platform_specifics
         )
 
-        generated_text = self.generate(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=0.7,
-            max_tokens=2048,
+        if sink is not None:
+            # Stream so the caller can render tokens as they arrive
+            parts = []
+            for chunk in self.generate_stream(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.7,
+                max_tokens=2048,
+            ):
+                sink(chunk)
+                parts.append(chunk)
+            generated_text = "".join(parts)
+        else:
+            generated_text = self.generate(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.7,
+                max_tokens=2048,
+            )
+
+        # Parse the generated response into structured format
+        result = self._parse_generated_response(generated_text, language)
+
+        log.info("Prompt generation completed successfully")
+        return result
+
+    async def agenerate_prompt_from_input(
+        self,
+        user_input: str,
+        entities: Dict,
+        language: str,
+        trending_elements: Dict,
+        platform_specifics: Optional[Dict] = None,
+        sink: Optional[Callable[[str], None]] = None,
+    ) -> Dict:
+        """
+        Async variant of generate_prompt_from_input for asyncio callers.
+
+        Args:
+            user_input: Original user input
+            entities: Detected entities
+            language: Input language
+            trending_elements: Trending elements to inject
+            platform_specifics: Platform-specific optimizations
+            sink: Optional callback receiving chunks as they stream in
+
+        Returns:
+            Dictionary containing all prompt components
+        """
+        system_prompt = self._get_system_prompt(language)
+
+        user_prompt = self._build_user_prompt(
+            user_input, entities, trending_elements, platform_specifics
         )
 
+        if sink is not None:
+            # Stream so the caller can render tokens as they arrive
+            parts = []
+            async for chunk in self.agenerate_stream(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.7,
+                max_tokens=2048,
+            ):
+                sink(chunk)
+                parts.append(chunk)
+            generated_text = "".join(parts)
+        else:
+            generated_text = await self.agenerate(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.7,
+                max_tokens=2048,
+            )
+
         # Parse the generated response into structured format
         result = self._parse_generated_response(generated_text, language)
 
         log.info("Prompt generation completed successfully")
         return result
 
-    def _get_system_prompt(self, language: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_system_prompt(language: str) -> str:
         """
-        Get system prompt for AI.
+        Get system prompt for AI (memoized per language).
 
         Args:
             language: Output language
@@ -181,63 +555,71 @@ Ensure prompts are:
         Returns:
             Formatted user prompt
         """
-        prompt_parts = [
-            f"# User Input:\n{user_input}\n",
-        ]
+        # Static instruction first so every request shares a byte-identical
+        # prefix (system prompt + this header) for provider prompt caching;
+        # dynamic sections follow in increasing volatility. One StringIO
+        # writer materializes the prompt exactly once instead of joining
+        # per-section intermediate lists.
+        out = StringIO()
+        out.write(
+            "Generate a complete, detailed, and optimized prompt for "
+            "text-to-video generation following the specified format, "
+            "based on the information below.\n\n"
+        )
+        out.write(f"# User Input:\n{user_input}\n")
 
-        # Add entity information
         if entities:
-            entities_text = "\n".join(
-                [f"- {key}: {value}" for key, value in entities.items() if value]
-            )
-            prompt_parts.append(f"# Detected Entities:\n{entities_text}\n")
+            out.write("\n# Detected Entities:\n")
+            for key, value in entities.items():
+                if value:
+                    out.write(f"- {key}: {value}\n")
 
-        # Add trending elements
         if trending_elements:
-            trending_text = self._format_trending_elements(trending_elements)
-            prompt_parts.append(f"# Trending Elements:\n{trending_text}\n")
+            out.write("\n# Trending Elements:\n")
+            if trending_elements.get("format"):
+                out.write(f"- Format: {trending_elements['format']['name']}\n")
+            if trending_elements.get("visual_style"):
+                style = trending_elements["visual_style"]
+                out.write(f"- Visual Style: {style['name']} ({style['style']})\n")
+            if trending_elements.get("hooks"):
+                out.write(f"- Example Hooks: {', '.join(trending_elements['hooks'][:3])}\n")
+            if trending_elements.get("hashtags"):
+                out.write(f"- Hashtags: {', '.join(trending_elements['hashtags'][:10])}\n")
 
-        # Add platform specifics
         if platform_specifics:
-            platform_text = self._format_platform_specifics(platform_specifics)
-            prompt_parts.append(f"# Platform Specifics:\n{platform_text}\n")
-
-        prompt_parts.append(
-            "\nBased on the information above, generate a complete, detailed, and optimized prompt for text-to-video generation following the specified format."
-        )
-
-        return "\n".join(prompt_parts)
-
-    def _format_trending_elements(self, trending_elements: Dict) -> str:
-        """Format trending elements for prompt."""
-        parts = []
-
-        if trending_elements.get("format"):
-            parts.append(f"- Format: {trending_elements['format']['name']}")
+            # Written as one pre-memoized block (see _format_platform_rows)
+            out.write("\n# Platform Specifics:\n")
+            out.write(self._format_platform_specifics(platform_specifics))
+            out.write("\n")
 
-        if trending_elements.get("visual_style"):
-            style = trending_elements["visual_style"]
-            parts.append(f"- Visual Style: {style['name']} ({style['style']})")
-
-        if trending_elements.get("hooks"):
-            hooks_str = ", ".join(trending_elements["hooks"][:3])
-            parts.append(f"- Example Hooks: {hooks_str}")
-
-        if trending_elements.get("hashtags"):
-            hashtags_str = ", ".join(trending_elements["hashtags"][:10])
-            parts.append(f"- Hashtags: {hashtags_str}")
-
-        return "\n".join(parts)
+        return out.getvalue()
 
     def _format_platform_specifics(self, platform_specifics: Dict) -> str:
         """Format platform-specific information for prompt."""
+        # Reduce to a hashable key so repeated platform selections reuse
+        # the memoized formatting below
+        rows = tuple(
+            (
+                platform,
+                specs.aspect_ratio,
+                specs.characteristics,
+                specs.optimal_length,
+            )
+            for platform, specs in platform_specifics.items()
+        )
+        return self._format_platform_rows(rows)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _format_platform_rows(rows: tuple) -> str:
+        """Format platform rows for prompt (memoized per selection)."""
         parts = []
 
-        for platform, specs in platform_specifics.items():
+        for platform, aspect_ratio, characteristics, optimal_length in rows:
             parts.append(f"\n## {platform.capitalize()}:")
-            parts.append(f"- Aspect Ratio: {specs['aspect_ratio']}")
-            parts.append(f"- Characteristics: {specs['characteristics']}")
-            parts.append(f"- Optimal Length: {specs['optimal_length']}")
+            parts.append(f"- Aspect Ratio: {aspect_ratio}")
+            parts.append(f"- Characteristics: {characteristics}")
+            parts.append(f"- Optimal Length: {optimal_length}")
 
         return "\n".join(parts)
 
@@ -259,3 +641,19 @@ Ensure prompts are:
             "language": language,
             "generated_at": None,  # Would be set to datetime.now()
         }
+
+
+@lru_cache(maxsize=1)
+def get_groq_client() -> GroqClient:
+    """
+    Return the shared GroqClient instance (created lazily).
+
+    A single instance means one warm connection pool and one settings
+    read for the whole process, mirroring get_settings().
+
+    Returns:
+        The process-wide GroqClient
+    """
+    client = GroqClient()
+    atexit.register(client._http.close)
+    return client
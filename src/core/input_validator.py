@@ -1,19 +1,162 @@
 """Input Validator module for sanitizing and analyzing user input."""
+import asyncio
+import hashlib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
+from cachetools import TTLCache
 from langdetect import detect, LangDetectException
 from config.logging_config import log
 
+try:
+    # Optional: persists validation results across process restarts so
+    # re-running the same inputs (dev iteration, A/B runs) skips language
+    # detection and extraction entirely
+    import diskcache
+except ImportError:
+    diskcache = None
+
+_VALIDATION_CACHE_DIR = ".cache/input_validator"
+_VALIDATION_CACHE_TTL = 86400  # seconds
+
+try:
+    # Optional: fastText language identification is ~10-50x faster than
+    # the pure-Python langdetect port
+    import fasttext
+except ImportError:
+    fasttext = None
+
+try:
+    # Aho-Corasick automaton matches all entity keywords in one linear
+    # pass over the text instead of one regex scan per category
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_FASTTEXT_MODEL_PATH = Path("data/lid.176.ftz")
+
+
+# Sanitization patterns, compiled once at import
+_WS_RE = re.compile(r"\s+")
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style)[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_DANGEROUS_RE = re.compile(
+    r"javascript:|on\w+\s*=|data:text/html", re.IGNORECASE
+)
+
+# Keyword alternations per entity category
+CATEGORY_KEYWORDS = {
+    "products": [
+        r"skincare",
+        r"makeup",
+        r"clothing|pakaian|baju",
+        r"food|makanan",
+        r"drink|minuman",
+        r"gadget",
+        r"phone|handphone|hp",
+        r"shoes|sepatu",
+        r"bag|tas",
+        r"book|buku",
+    ],
+    "topics": [
+        r"review",
+        r"tutorial",
+        r"tips",
+        r"vlog",
+        r"challenge",
+        r"reaction",
+        r"unboxing",
+        r"testimoni",
+        r"promosi|promo",
+    ],
+    "emotions": [
+        r"excited|exciting|seru",
+        r"happy|joyful|bahagia|senang",
+        r"sad|sadness|sedih",
+        r"angry|furious|marah",
+        r"funny|humorous|lucu",
+        r"inspiring|motivational|inspiratif|motivasi",
+        r"calm|peaceful|tenang",
+        r"energetic",
+    ],
+    "target_audience": [
+        r"teen|teens|remaja",
+        r"kids|children|anak-anak",
+        r"adult|adults|dewasa",
+        r"student|students|mahasiswa|pelajar",
+        r"mom|mother|moms|ibu",
+        r"professionals|profesional",
+        r"gamer|gamers",
+    ],
+}
+
+# Flatten each category's alternations into a deduplicated literal set
+# so neither matcher carries redundant branches
+_CATEGORY_LITERALS = {
+    category: frozenset(
+        literal for entry in keywords for literal in entry.split("|")
+    )
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+# One compiled alternation per category, shared across instances
+# (fallback path when pyahocorasick is unavailable). Longest literals
+# first so e.g. "promosi" is preferred over its prefix "promo".
+_CATEGORY_PATTERNS = {
+    category: re.compile(
+        "|".join(map(re.escape, sorted(literals, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
+    for category, literals in _CATEGORY_LITERALS.items()
+}
+
+
+def _build_automaton() -> "ahocorasick.Automaton":
+    """Build one Aho-Corasick automaton covering every category keyword."""
+    literal_categories: Dict[str, set] = {}
+    for category, literals in _CATEGORY_LITERALS.items():
+        for literal in literals:
+            literal_categories.setdefault(literal, set()).add(category)
+
+    automaton = ahocorasick.Automaton()
+    for literal, categories in literal_categories.items():
+        automaton.add_word(literal, (literal, frozenset(categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
 
 class InputValidator:
     """Validates and analyzes user input text."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize input validator."""
-        self.min_length = 5
-        self.max_length = 2000
-
-    def validate(self, text: str) -> Dict[str, any]:
+        # Annotated so the module stays mypyc/Cython-compilable should a
+        # build step ever be added; today the hot paths (regex, automaton,
+        # fastText) already run in C extensions
+        self.min_length: int = 5
+        self.max_length: int = 2000
+
+        # Load the fastText language model once if the optional
+        # dependency and model file are available
+        self._lid_model = None
+        if fasttext is not None and _FASTTEXT_MODEL_PATH.exists():
+            self._lid_model = fasttext.load_model(str(_FASTTEXT_MODEL_PATH))
+            log.info("Using fastText for language detection")
+
+        # Disk-backed when diskcache is available, in-process otherwise
+        if diskcache is not None:
+            self._val_cache = diskcache.Cache(_VALIDATION_CACHE_DIR)
+        else:
+            self._val_cache = TTLCache(maxsize=512, ttl=_VALIDATION_CACHE_TTL)
+
+    def validate(self, text: str) -> Dict[str, object]:
         """
         Validate input text and return analysis results.
 
@@ -26,6 +169,13 @@ class InputValidator:
         # Sanitize text
         sanitized = self._sanitize(text)
 
+        # Reuse prior analysis of identical sanitized input
+        cache_key = hashlib.sha256(sanitized.encode("utf-8")).hexdigest()
+        cached = self._val_cache.get(cache_key)
+        if cached is not None:
+            log.debug("Validation cache hit")
+            return cached
+
         # Validate length
         if not self._validate_length(sanitized):
             log.warning(f"Input length invalid: {len(sanitized)} characters")
@@ -43,7 +193,7 @@ class InputValidator:
 
         log.info(f"Input validated successfully. Language: {language}, Entities: {len(entities)}")
 
-        return {
+        result = {
             "valid": True,
             "sanitized": sanitized,
             "language": language,
@@ -51,6 +201,53 @@ class InputValidator:
             "length": len(sanitized),
         }
 
+        if diskcache is not None:
+            self._val_cache.set(cache_key, result, expire=_VALIDATION_CACHE_TTL)
+        else:
+            self._val_cache[cache_key] = result
+
+        return result
+
+    def validate_many(
+        self, texts: List[str], workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Validate a batch of inputs in parallel across processes.
+
+        Language detection is CPU-bound and holds the GIL, so a process
+        pool gives true parallelism for large batches.
+
+        Args:
+            texts: User input texts
+            workers: Number of worker processes (default: cpu count)
+
+        Returns:
+            Validation result dictionaries in input order
+        """
+        if len(texts) <= 1:
+            return [self.validate(text) for text in texts]
+
+        workers = workers or os.cpu_count()
+        chunksize = max(1, len(texts) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_validate_worker, texts, chunksize=chunksize))
+
+    async def avalidate_many(self, texts: List[str]) -> List[Dict]:
+        """
+        Validate a batch of inputs without blocking the event loop.
+
+        Args:
+            texts: User input texts
+
+        Returns:
+            Validation result dictionaries in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(self.validate, text) for text in texts)
+            )
+        )
+
     def _sanitize(self, text: str) -> str:
         """
         Sanitize input text by removing harmful content and extra whitespace.
@@ -61,23 +258,20 @@ class InputValidator:
         Returns:
             Sanitized text
         """
-        # Remove extra whitespace
-        sanitized = " ".join(text.split())
-
-        # Remove script and style elements with content
-        sanitized = re.sub(r"<(script|style)[^>]*>.*?</\1>", "", sanitized, flags=re.IGNORECASE | re.DOTALL)
+        # Collapse whitespace without building an intermediate token list
+        sanitized = _WS_RE.sub(" ", text).strip()
 
-        # Remove other HTML/XML tags
-        sanitized = re.sub(r"<[^>]+>", "", sanitized)
+        # Cheap C-level membership tests gate the regex passes: most real
+        # inputs contain no markup, so the engine is never invoked
+        if "<" in sanitized:
+            # Remove script and style elements with content
+            sanitized = _SCRIPT_STYLE_RE.sub("", sanitized)
+            # Remove other HTML/XML tags
+            sanitized = _TAG_RE.sub("", sanitized)
 
-        # Remove potentially dangerous content
-        dangerous_patterns = [
-            r"javascript:",
-            r"on\w+\s*=",
-            r"data:text/html",
-        ]
-        for pattern in dangerous_patterns:
-            sanitized = re.sub(pattern, "", sanitized, flags=re.IGNORECASE)
+        # Every dangerous pattern contains ':' or '='
+        if ":" in sanitized or "=" in sanitized:
+            sanitized = _DANGEROUS_RE.sub("", sanitized)
 
         return sanitized.strip()
 
@@ -103,6 +297,12 @@ class InputValidator:
         Returns:
             Language code (e.g., 'id', 'en', 'es')
         """
+        if self._lid_model is not None:
+            labels, _ = self._lid_model.predict(text.replace("\n", " "), k=1)
+            lang = labels[0].removeprefix("__label__")
+            log.debug(f"Detected language: {lang}")
+            return lang
+
         try:
             lang = detect(text)
             log.debug(f"Detected language: {lang}")
@@ -121,99 +321,32 @@ class InputValidator:
         Returns:
             Dictionary of entity categories and their values
         """
-        entities = {
-            "products": self._extract_products(text),
-            "topics": self._extract_topics(text),
-            "emotions": self._extract_emotions(text),
-            "target_audience": self._extract_target_audience(text),
+        # Lowercase once and share across both matching paths instead of
+        # copying the input per category / per match
+        text_lower = text.lower()
+
+        if _AUTOMATON is not None:
+            # Single O(len(text)) pass over the input for all keywords
+            found = {category: set() for category in CATEGORY_KEYWORDS}
+            for _, (literal, categories) in _AUTOMATON.iter(text_lower):
+                for category in categories:
+                    found[category].add(literal)
+            return {category: list(values) for category, values in found.items()}
+
+        return {
+            category: list({m.group(0) for m in pattern.finditer(text_lower)})
+            for category, pattern in _CATEGORY_PATTERNS.items()
         }
 
-        return entities
-
-    def _extract_products(self, text: str) -> List[str]:
-        """Extract product mentions from text."""
-        # Common product categories and keywords
-        product_keywords = [
-            r"skincare",
-            r"makeup",
-            r"clothing|pakaian|baju",
-            r"food|makanan",
-            r"drink|minuman",
-            r"gadget",
-            r"phone|handphone|hp",
-            r"shoes|sepatu",
-            r"bag|tas",
-            r"book|buku",
-        ]
-
-        products = []
-        text_lower = text.lower()
-        for keyword in product_keywords:
-            matches = re.findall(keyword, text_lower)
-            products.extend(matches)
-
-        return list(set(products))
-
-    def _extract_topics(self, text: str) -> List[str]:
-        """Extract topic keywords from text."""
-        # Common topic categories
-        topic_keywords = [
-            r"review",
-            r"tutorial",
-            r"tips",
-            r"vlog",
-            r"challenge",
-            r"reaction",
-            r"unboxing",
-            r"testimoni|testimoni|review",
-            r"promosi|promosi|promo",
-        ]
-
-        topics = []
-        text_lower = text.lower()
-        for keyword in topic_keywords:
-            matches = re.findall(keyword, text_lower)
-            topics.extend(matches)
-
-        return list(set(topics))
-
-    def _extract_emotions(self, text: str) -> List[str]:
-        """Extract emotional keywords from text."""
-        emotion_keywords = [
-            r"excited|exciting|seru",
-            r"happy|joyful|bahagia|senang",
-            r"sad|sadness|sedih",
-            r"angry|furious|marah",
-            r"funny|humorous|lucu",
-            r"inspiring|motivational|inspiratif|motivasi",
-            r"calm|peaceful|tenang",
-            r"energetic|energetic",
-        ]
-
-        emotions = []
-        text_lower = text.lower()
-        for keyword in emotion_keywords:
-            matches = re.findall(keyword, text_lower)
-            emotions.extend(matches)
-
-        return list(set(emotions))
-
-    def _extract_target_audience(self, text: str) -> List[str]:
-        """Extract target audience mentions from text."""
-        audience_keywords = [
-            r"teen|teens|remaja",
-            r"kids|children|anak-anak",
-            r"adult|adults|dewasa",
-            r"student|students|mahasiswa|pelajar",
-            r"mom|mother|moms|ibu",
-            r"professionals|profesional",
-            r"gamer|gamers",
-        ]
-
-        audience = []
-        text_lower = text.lower()
-        for keyword in audience_keywords:
-            matches = re.findall(keyword, text_lower)
-            audience.extend(matches)
 
-        return list(set(audience))
+# Per-process validator for ProcessPoolExecutor workers; bound methods
+# would drag the whole parent instance through pickle
+_WORKER_VALIDATOR: Optional[InputValidator] = None
+
+
+def _validate_worker(text: str) -> Dict:
+    """Validate one input using a validator local to the worker process."""
+    global _WORKER_VALIDATOR
+    if _WORKER_VALIDATOR is None:
+        _WORKER_VALIDATOR = InputValidator()
+    return _WORKER_VALIDATOR.validate(text)
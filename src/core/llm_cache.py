@@ -0,0 +1,95 @@
+"""Response cache for LLM calls."""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+try:
+    # Rust-based encoder, several times faster than stdlib json for the
+    # per-request key canonicalization below
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+from config.logging_config import log
+
+
+def make_key(model: str, messages: list, temperature: float, max_tokens: int) -> str:
+    """
+    Build a deterministic cache key for a chat completion request.
+
+    Args:
+        model: Model identifier
+        messages: Chat messages payload
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+
+    Returns:
+        SHA-256 hex digest of the canonicalized request
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if orjson is not None:
+        canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode(
+            "utf-8"
+        )
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Minimal interface for pluggable LLM response caches."""
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None."""
+        ...
+
+    def set(self, key: str, value: str, ttl: int = 3600) -> None:
+        """Store a response under key with a time-to-live in seconds."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry TTL."""
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize memory cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if absent/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            self.stats["misses"] += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats["hits"] += 1
+        log.debug(f"LLM cache hit ({self.stats['hits']} hits)")
+        return value
+
+    def set(self, key: str, value: str, ttl: int = 3600) -> None:
+        """Store a response under key, evicting the oldest entry if full."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
@@ -90,11 +90,11 @@ class OutputFormatter:
 
             for platform, specs in platform_specifics.items():
                 md_parts.append(f"**{platform.capitalize()}:**")
-                md_parts.append(f"- Aspect Ratio: {specs['aspect_ratio']}")
-                md_parts.append(f"- Characteristics: {specs['characteristics']}")
-                md_parts.append(f"- Optimal Length: {specs['optimal_length']}")
-                md_parts.append(f"- Caption: {specs.get('caption_style', 'N/A')}")
-                md_parts.append(f"- Editing Tips: {specs.get('editing_tips', 'N/A')}")
+                md_parts.append(f"- Aspect Ratio: {specs.aspect_ratio}")
+                md_parts.append(f"- Characteristics: {specs.characteristics}")
+                md_parts.append(f"- Optimal Length: {specs.optimal_length}")
+                md_parts.append(f"- Caption: {specs.caption_style}")
+                md_parts.append(f"- Editing Tips: {specs.editing_tips}")
                 md_parts.append("")
 
             md_parts.append("---\n")
@@ -174,8 +174,8 @@ class OutputFormatter:
             # Show top 2 platforms
             for i, (platform, specs) in enumerate(list(platform_specifics.items())[:2]):
                 message_parts.append(f"\n*{platform.capitalize()}*:")
-                message_parts.append(f"• Ratio: {specs['aspect_ratio']}")
-                message_parts.append(f"• Length: {specs['optimal_length']}")
+                message_parts.append(f"• Ratio: {specs.aspect_ratio}")
+                message_parts.append(f"• Length: {specs.optimal_length}")
 
             message_parts.append("")
 
@@ -1,34 +1,150 @@
 """Platform Optimizer for TikTok, Instagram Reels, and YouTube Shorts."""
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
 from config.logging_config import log
 
 
+@dataclass(frozen=True, slots=True)
+class PlatformOutput:
+    """Immutable per-platform optimization result.
+
+    Slots give cheap attribute access and block accidental mutation of
+    the shared singletons below.
+    """
+
+    platform: str
+    aspect_ratio: str
+    max_duration: str
+    resolution: str
+    characteristics: str
+    optimal_length: str
+    caption_style: str
+    music_suggestion: str
+    editing_tips: str
+    posting_time: str
+
+
+PLATFORM_SPECS = {
+    "tiktok": {
+        "aspect_ratio": "9:16",
+        "max_duration": "60s",
+        "resolution": "1080x1920",
+        "characteristics": "fast-paced, energetic, trending sounds, hook in first 3 seconds",
+        "optimal_length": "15-30s",
+    },
+    "instagram": {
+        "aspect_ratio": "9:16",
+        "max_duration": "90s",
+        "resolution": "1080x1920",
+        "characteristics": "high production quality, aesthetic, saveable content, carousel ready",
+        "optimal_length": "15-60s",
+    },
+    "youtube": {
+        "aspect_ratio": "9:16",
+        "max_duration": "60s",
+        "resolution": "1080x1920",
+        "characteristics": "engaging, teaser for longer content, subscribe CTA",
+        "optimal_length": "30-60s",
+    },
+}
+
+# Platform-specific customizations beyond the base specs
+_PLATFORM_EXTRAS = {
+    "tiktok": {
+        "caption_style": "catchy, short, include trending hashtags",
+        "music_suggestion": "Use trending sounds from TikTok library",
+        "editing_tips": "Quick cuts, text overlays, green screen effects",
+        "posting_time": "Peak hours: 7-9 AM, 12-3 PM, 7-11 PM",
+    },
+    "instagram": {
+        "caption_style": "engaging, include questions for engagement",
+        "music_suggestion": "Use trending Instagram Reels audio",
+        "editing_tips": "High quality, smooth transitions, aesthetic",
+        "posting_time": "Peak hours: 11 AM, 7 PM, 9 PM",
+    },
+    "youtube": {
+        "caption_style": "informative, include subscribe reminder",
+        "music_suggestion": "Use royalty-free or trending Shorts audio",
+        "editing_tips": "Engaging hook, subscribe CTA at end",
+        "posting_time": "Peak hours: 2-4 PM, 7-10 PM",
+    },
+}
+
+# Fully optimized per-platform content, built once at import as frozen
+# singletons so callers share references instead of rebuilding dicts
+_OPTIMIZED = {
+    platform: PlatformOutput(
+        platform=platform,
+        **specs,
+        **_PLATFORM_EXTRAS[platform],
+    )
+    for platform, specs in PLATFORM_SPECS.items()
+}
+
+_CAPTIONS_ID = {
+    "tiktok": (
+        "Gak nyangka bisa se-viral ini! 🤯",
+        "Wajib coba sebelum nyesel!",
+        "Share ke temen kamu yang butuh ini! 👯",
+        "Ini dia rahasianya! ✨",
+    ),
+    "instagram": (
+        "Simpan biar nggak lupa! 🔖",
+        "Kamu pernah coba ini? Drop di komen! 💬",
+        "Tag temen yang wajib tau ini! 👇",
+        "Double tap kalau suka! ❤️",
+    ),
+    "youtube": (
+        "Subscribe buat konten seru lainnya! 🔔",
+        "Nyesel baru tau sekarang! 😅",
+        "Yang masih belum tau, angkat tangan! 🙋",
+        "Share ke yang belum tahu! 📢",
+    ),
+}
+
+_CAPTIONS_EN = {
+    "tiktok": (
+        "Can't believe how viral this got! 🤯",
+        "Must try before you regret it!",
+        "Share with a friend who needs this! 👯",
+        "Here's the secret! ✨",
+    ),
+    "instagram": (
+        "Save this for later! 🔖",
+        "Have you tried this? Drop a comment! 💬",
+        "Tag a friend who needs to know this! 👇",
+        "Double tap if you like it! ❤️",
+    ),
+    "youtube": (
+        "Subscribe for more content like this! 🔔",
+        "Can't believe I just found out! 😅",
+        "Raise your hand if you didn't know! 🙋",
+        "Share with someone who doesn't know yet! 📢",
+    ),
+}
+
+_SCHEDULES = {
+    "tiktok": (
+        "7:00 AM - 9:00 AM",
+        "12:00 PM - 3:00 PM",
+        "7:00 PM - 11:00 PM",
+    ),
+    "instagram": (
+        "11:00 AM",
+        "7:00 PM",
+        "9:00 PM",
+    ),
+    "youtube": (
+        "2:00 PM - 4:00 PM",
+        "7:00 PM - 10:00 PM",
+    ),
+}
+
+
 class PlatformOptimizer:
     """Optimizes prompts for different social media platforms."""
 
-    PLATFORM_SPECS = {
-        "tiktok": {
-            "aspect_ratio": "9:16",
-            "max_duration": "60s",
-            "resolution": "1080x1920",
-            "characteristics": "fast-paced, energetic, trending sounds, hook in first 3 seconds",
-            "optimal_length": "15-30s",
-        },
-        "instagram": {
-            "aspect_ratio": "9:16",
-            "max_duration": "90s",
-            "resolution": "1080x1920",
-            "characteristics": "high production quality, aesthetic, saveable content, carousel ready",
-            "optimal_length": "15-60s",
-        },
-        "youtube": {
-            "aspect_ratio": "9:16",
-            "max_duration": "60s",
-            "resolution": "1080x1920",
-            "characteristics": "engaging, teaser for longer content, subscribe CTA",
-            "optimal_length": "30-60s",
-        },
-    }
+    PLATFORM_SPECS = PLATFORM_SPECS
 
     def __init__(self, platforms: Optional[List[str]] = None):
         """
@@ -37,10 +153,10 @@ class PlatformOptimizer:
         Args:
             platforms: List of target platforms (default: all platforms)
         """
-        self.platforms = platforms or list(self.PLATFORM_SPECS.keys())
+        self.platforms = platforms or list(PLATFORM_SPECS.keys())
         log.info(f"PlatformOptimizer initialized for: {self.platforms}")
 
-    def optimize_for_platform(self, platform: str, content: Dict) -> Dict:
+    def optimize_for_platform(self, platform: str, content: Dict) -> PlatformOutput:
         """
         Optimize content for a specific platform.
 
@@ -49,56 +165,17 @@ class PlatformOptimizer:
             content: Dictionary containing content elements
 
         Returns:
-            Platform-specific optimized content
+            Shared frozen PlatformOutput for the platform
         """
-        if platform not in self.PLATFORM_SPECS:
+        optimized = _OPTIMIZED.get(platform)
+        if optimized is None:
             log.warning(f"Unknown platform: {platform}, using default")
-            platform = "tiktok"
-
-        specs = self.PLATFORM_SPECS[platform]
-
-        optimized = {
-            "platform": platform,
-            "aspect_ratio": specs["aspect_ratio"],
-            "max_duration": specs["max_duration"],
-            "resolution": specs["resolution"],
-            "characteristics": specs["characteristics"],
-            "optimal_length": specs["optimal_length"],
-        }
+            optimized = _OPTIMIZED["tiktok"]
 
-        # Platform-specific customizations
-        if platform == "tiktok":
-            optimized.update(
-                {
-                    "caption_style": "catchy, short, include trending hashtags",
-                    "music_suggestion": "Use trending sounds from TikTok library",
-                    "editing_tips": "Quick cuts, text overlays, green screen effects",
-                    "posting_time": "Peak hours: 7-9 AM, 12-3 PM, 7-11 PM",
-                }
-            )
-        elif platform == "instagram":
-            optimized.update(
-                {
-                    "caption_style": "engaging, include questions for engagement",
-                    "music_suggestion": "Use trending Instagram Reels audio",
-                    "editing_tips": "High quality, smooth transitions, aesthetic",
-                    "posting_time": "Peak hours: 11 AM, 7 PM, 9 PM",
-                }
-            )
-        elif platform == "youtube":
-            optimized.update(
-                {
-                    "caption_style": "informative, include subscribe reminder",
-                    "music_suggestion": "Use royalty-free or trending Shorts audio",
-                    "editing_tips": "Engaging hook, subscribe CTA at end",
-                    "posting_time": "Peak hours: 2-4 PM, 7-10 PM",
-                }
-            )
-
-        log.info(f"Optimized content for {platform}")
+        log.info(f"Optimized content for {optimized.platform}")
         return optimized
 
-    def optimize_for_all_platforms(self, content: Dict) -> Dict[str, Dict]:
+    def optimize_for_all_platforms(self, content: Dict) -> Dict[str, PlatformOutput]:
         """
         Optimize content for all configured platforms.
 
@@ -149,9 +226,9 @@ class PlatformOptimizer:
         log.info(f"Recommended platform for {content_type}: {recommendation}")
         return recommendation
 
-    def get_caption_suggestions(self, platform: str, entities: Dict, language: str = "id") -> List[str]:
+    def get_caption_suggestions(self, platform: str, entities: Dict, language: str = "id") -> Sequence[str]:
         """
-        Generate caption suggestions for a platform.
+        Get caption suggestions for a platform.
 
         Args:
             platform: Platform name
@@ -159,54 +236,12 @@ class PlatformOptimizer:
             language: Output language
 
         Returns:
-            List of caption suggestions
+            Tuple of caption suggestions
         """
-        if language == "id":
-            captions = {
-                "tiktok": [
-                    "Gak nyangka bisa se-viral ini! 🤯",
-                    "Wajib coba sebelum nyesel!",
-                    "Share ke temen kamu yang butuh ini! 👯",
-                    "Ini dia rahasianya! ✨",
-                ],
-                "instagram": [
-                    "Simpan biar nggak lupa! 🔖",
-                    "Kamu pernah coba ini? Drop di komen! 💬",
-                    "Tag temen yang wajib tau ini! 👇",
-                    "Double tap kalau suka! ❤️",
-                ],
-                "youtube": [
-                    "Subscribe buat konten seru lainnya! 🔔",
-                    "Nyesel baru tau sekarang! 😅",
-                    "Yang masih belum tau, angkat tangan! 🙋",
-                    "Share ke yang belum tahu! 📢",
-                ],
-            }
-        else:
-            captions = {
-                "tiktok": [
-                    "Can't believe how viral this got! 🤯",
-                    "Must try before you regret it!",
-                    "Share with a friend who needs this! 👯",
-                    "Here's the secret! ✨",
-                ],
-                "instagram": [
-                    "Save this for later! 🔖",
-                    "Have you tried this? Drop a comment! 💬",
-                    "Tag a friend who needs to know this! 👇",
-                    "Double tap if you like it! ❤️",
-                ],
-                "youtube": [
-                    "Subscribe for more content like this! 🔔",
-                    "Can't believe I just found out! 😅",
-                    "Raise your hand if you didn't know! 🙋",
-                    "Share with someone who doesn't know yet! 📢",
-                ],
-            }
-
+        captions = _CAPTIONS_ID if language == "id" else _CAPTIONS_EN
         return captions.get(platform, captions["tiktok"])
 
-    def get_posting_schedule(self, platform: str) -> List[str]:
+    def get_posting_schedule(self, platform: str) -> Sequence[str]:
         """
         Get recommended posting schedule for a platform.
 
@@ -214,23 +249,6 @@ class PlatformOptimizer:
             platform: Platform name
 
         Returns:
-            List of optimal posting times
+            Tuple of optimal posting times
         """
-        schedules = {
-            "tiktok": [
-                "7:00 AM - 9:00 AM",
-                "12:00 PM - 3:00 PM",
-                "7:00 PM - 11:00 PM",
-            ],
-            "instagram": [
-                "11:00 AM",
-                "7:00 PM",
-                "9:00 PM",
-            ],
-            "youtube": [
-                "2:00 PM - 4:00 PM",
-                "7:00 PM - 10:00 PM",
-            ],
-        }
-
-        return schedules.get(platform, schedules["tiktok"])
+        return _SCHEDULES.get(platform, _SCHEDULES["tiktok"])
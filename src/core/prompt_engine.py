@@ -1,13 +1,125 @@
 """Prompt Engine - Main orchestrator for prompt generation."""
+import asyncio
+import hashlib
+import re
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Dict, Optional
+from cachetools import TTLCache
 from src.core.input_validator import InputValidator
-from src.core.trending_injector import TrendingInjector
-from src.core.groq_client import GroqClient
+from src.core.trending_injector import TrendingInjector, _dedupe_cap
+from src.core.groq_client import get_groq_client
 from src.core.platform_optimizer import PlatformOptimizer
 from src.core.output_formatter import OutputFormatter
 from config.logging_config import log
 
 
+# Cheap substring pre-screen: only run the line scan when some section
+# name appears in the (shared, uppercased-once) response.
+_SCRIPT_HINTS = ("HOOK", "BODY", "CTA", "CALL TO ACTION")
+
+# Hash-prefixed word tokens, used by the batch hashtag path
+_HASHTAG_RE = re.compile(r"#(\w+)")
+
+# Script-header dispatch table: normalized token prefix -> section.
+# "call to action" before "cta" so the long form is recognized whole.
+_SECTION_TOKENS = (
+    ("call to action", "cta"),
+    ("hook", "hook"),
+    ("body", "body"),
+    ("cta", "cta"),
+)
+
+# Leading decoration stripped off candidate header lines: Markdown
+# hashes, bold asterisks, list numbering and indentation
+_HEADER_DECOR = "#*0123456789. \t"
+
+
+def _match_script_header(line: str) -> Optional[tuple]:
+    """
+    Classify a line as a script section header, if it is one.
+
+    Handles ## Hook, ## **Hook**, ## ***Hook***, ### Body, 1. CTA:,
+    Hook [0:00-0:03] and Call to Action variants with a few C-level
+    string operations instead of a backtracking regex.
+
+    Args:
+        line: Stripped line from the AI response
+
+    Returns:
+        (section, inline_content) when the line is a header, else None
+    """
+    token = line.lstrip(_HEADER_DECOR)
+    low = token.lower()
+    for prefix, section in _SECTION_TOKENS:
+        if low.startswith(prefix):
+            rest = token[len(prefix):].lstrip("*").lstrip()
+            if rest.startswith("["):
+                close = rest.find("]")
+                if close != -1:
+                    rest = rest[close + 1:].lstrip()
+            if not rest:
+                return section, ""
+            if rest.startswith(":"):
+                return section, rest[1:].strip()
+            # Prefix hit inside prose (e.g. "Body lotion is ...")
+            return None
+    return None
+
+
+@dataclass
+class PromptResult:
+    """
+    Successful generation result with lazily formatted outputs.
+
+    The Markdown and Telegram renderings are computed on first access
+    instead of on every generation, so structured-only callers skip
+    both formatter passes entirely. Dict-style access (``result[key]``,
+    ``result.get(key)``, ``key in result``) is kept for existing callers.
+    """
+
+    success: bool
+    user_input: str
+    sanitized_input: str
+    language: str
+    entities: Dict
+    structured_result: Dict
+    platform_specifics: Dict
+    _formatter: OutputFormatter = field(repr=False)
+
+    @cached_property
+    def markdown_output(self) -> str:
+        """Markdown rendering, formatted once on first access."""
+        return self._formatter.format_markdown(
+            self.structured_result, self.platform_specifics
+        )
+
+    @cached_property
+    def telegram_output(self) -> str:
+        """Telegram rendering, formatted once on first access."""
+        return self._formatter.format_telegram_message(
+            self.structured_result, self.platform_specifics
+        )
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+
+@lru_cache(maxsize=32)
+def _get_optimizer(platforms_key: tuple) -> PlatformOptimizer:
+    """Return a shared optimizer for a non-default platform selection."""
+    return PlatformOptimizer(list(platforms_key))
+
+
 class PromptEngine:
     """Main engine for generating optimized UGC prompts."""
 
@@ -20,13 +132,64 @@ class PromptEngine:
         """
         self.validator = InputValidator()
         self.trending_injector = TrendingInjector()
-        self.groq_client = GroqClient()
+        self.groq_client = get_groq_client()
         self.platform_optimizer = PlatformOptimizer(platforms)
         self.formatter = OutputFormatter()
 
         self.last_generated = None
+
+        # Repeated ideas (retries, /debug after /generate) skip the Groq
+        # round trip entirely for an hour
+        self._result_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         log.info("PromptEngine initialized with all components")
 
+    @staticmethod
+    def _cache_key(
+        sanitized_input: str, language: str, platforms: Optional[list] = None
+    ) -> str:
+        """
+        Build a normalized cache key for a generation request.
+
+        Keyed on the sanitized input rather than the raw text, so inputs
+        that only differ in markup or whitespace share an entry.
+
+        Args:
+            sanitized_input: Sanitized user input
+            language: Detected input language
+            platforms: List of target platforms (optional)
+
+        Returns:
+            Hex digest key
+        """
+        normalized = sanitized_input.lower() + "|" + language
+        if platforms:
+            normalized += "|" + ",".join(platforms)
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_lookup(self, key: str) -> Optional[Dict]:
+        """Return a cached result for key, updating hit/miss counters."""
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            log.info(f"Prompt cache hit ({self._cache_hits} hits)")
+            # Refresh export state so /export works after a cached reply
+            self.last_generated = cached
+            return cached
+        self._cache_misses += 1
+        return None
+
+    def cache_stats(self) -> Dict:
+        """Return hit/miss/size statistics for the result cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._result_cache),
+            "maxsize": self._result_cache.maxsize,
+        }
+
     def generate_prompt(self, user_input: str, platforms: Optional[list] = None) -> Dict:
         """
         Generate a complete prompt for text-to-video generation.
@@ -39,95 +202,218 @@ class PromptEngine:
             Dictionary containing all prompt components and outputs
         """
         try:
-            log.info(f"Starting prompt generation for: '{user_input[:50]}...'")
-
-            # Step 1: Validate and analyze input
-            validation_result = self.validator.validate(user_input)
-            if not validation_result["valid"]:
-                log.error(f"Validation failed: {validation_result['error']}")
-                return {
-                    "success": False,
-                    "error": validation_result["error"],
-                    "user_input": user_input,
-                }
-
-            log.info("Input validation successful")
-
-            # Extract relevant data
-            sanitized_input = validation_result["sanitized"]
-            language = validation_result["language"]
-            entities = validation_result["entities"]
-
-            # Step 2: Inject trending elements
-            trending_elements = self.trending_injector.inject(entities, language)
-            log.info("Trending elements injected")
-
-            # Step 3: Optimize for platforms
-            if platforms:
-                optimizer = PlatformOptimizer(platforms)
-            else:
-                optimizer = self.platform_optimizer
+            # Steps 1-3: Validate input, inject trends, optimize platforms
+            prepared = self._prepare_generation(user_input, platforms)
+            if not prepared["success"]:
+                return prepared
 
-            platform_specifics = optimizer.optimize_for_all_platforms(
-                {"entities": entities, "language": language}
+            cache_key = self._cache_key(
+                prepared["sanitized_input"], prepared["language"], platforms
             )
-            log.info("Platform optimization completed")
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                return cached
 
             # Step 4: Generate AI prompt
             ai_result = self.groq_client.generate_prompt_from_input(
-                user_input=sanitized_input,
-                entities=entities,
-                language=language,
-                trending_elements=trending_elements,
-                platform_specifics=platform_specifics,
+                user_input=prepared["sanitized_input"],
+                entities=prepared["entities"],
+                language=prepared["language"],
+                trending_elements=prepared["trending_elements"],
+                platform_specifics=prepared["platform_specifics"],
             )
             log.info("AI generation completed")
 
-            # Step 5: Parse and structure the result
-            # For now, we'll use a simple structure based on the AI response
-            # In production, we would parse this more carefully
-            structured_result = self._structure_result(
-                ai_result, trending_elements, platform_specifics, language
-            )
+            # Steps 5-6: Structure and format the result
+            result = self._assemble_result(user_input, prepared, ai_result)
+            self._result_cache[cache_key] = result
+            return result
+
+        except Exception as e:
+            log.opt(exception=True).error("Error in prompt generation: {}", e)
+            return {
+                "success": False,
+                "error": str(e),
+                "user_input": user_input,
+            }
+
+    async def agenerate_prompt(self, user_input: str, platforms: Optional[list] = None) -> Dict:
+        """
+        Async variant of generate_prompt for asyncio callers.
+
+        Awaits the Groq API directly instead of dispatching the blocking
+        client to a thread pool, so one event loop can handle many
+        concurrent generations.
 
-            # Step 6: Format outputs
-            markdown_output = self.formatter.format_markdown(
-                structured_result, platform_specifics
+        Args:
+            user_input: User's content idea or description
+            platforms: List of target platforms (optional)
+
+        Returns:
+            Dictionary containing all prompt components and outputs
+        """
+        try:
+            # Steps 1-3: Validate input, inject trends, optimize platforms
+            prepared = self._prepare_generation(user_input, platforms)
+            if not prepared["success"]:
+                return prepared
+
+            cache_key = self._cache_key(
+                prepared["sanitized_input"], prepared["language"], platforms
             )
-            telegram_output = self.formatter.format_telegram_message(
-                structured_result, platform_specifics
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                return cached
+
+            # Step 4: Generate AI prompt (non-blocking)
+            ai_result = await self.groq_client.agenerate_prompt_from_input(
+                user_input=prepared["sanitized_input"],
+                entities=prepared["entities"],
+                language=prepared["language"],
+                trending_elements=prepared["trending_elements"],
+                platform_specifics=prepared["platform_specifics"],
             )
+            log.info("AI generation completed")
 
-            # Store last generated for export functionality
-            self.last_generated = {
-                "structured": structured_result,
-                "markdown": markdown_output,
-                "telegram": telegram_output,
-                "platform_specifics": platform_specifics,
-            }
-
-            log.info("Prompt generation completed successfully")
+            # Steps 5-6: Structure and format the result
+            result = self._assemble_result(user_input, prepared, ai_result)
+            self._result_cache[cache_key] = result
+            return result
 
+        except Exception as e:
+            log.opt(exception=True).error("Error in prompt generation: {}", e)
             return {
-                "success": True,
+                "success": False,
+                "error": str(e),
                 "user_input": user_input,
-                "sanitized_input": sanitized_input,
-                "language": language,
-                "entities": entities,
-                "structured_result": structured_result,
-                "markdown_output": markdown_output,
-                "telegram_output": telegram_output,
-                "platform_specifics": platform_specifics,
             }
 
-        except Exception as e:
-            log.error(f"Error in prompt generation: {e}", exc_info=True)
+    async def agenerate_prompt_many(
+        self,
+        inputs: list,
+        platforms: Optional[list] = None,
+        concurrency: int = 8,
+    ) -> list:
+        """
+        Generate prompts for several inputs concurrently.
+
+        Args:
+            inputs: User content ideas
+            platforms: List of target platforms (optional)
+            concurrency: Maximum in-flight Groq requests
+
+        Returns:
+            Result dictionaries in the same order as inputs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(user_input: str) -> Dict:
+            async with semaphore:
+                return await self.agenerate_prompt(user_input, platforms)
+
+        return list(
+            await asyncio.gather(*(generate_one(text) for text in inputs))
+        )
+
+    def _prepare_generation(self, user_input: str, platforms: Optional[list] = None) -> Dict:
+        """
+        Run the pre-AI pipeline: validation, trending injection, optimization.
+
+        Args:
+            user_input: User's content idea or description
+            platforms: List of target platforms (optional)
+
+        Returns:
+            Dictionary with prepared inputs, or an error result if invalid
+        """
+        log.info("Starting prompt generation for: '{}...'", user_input[:50])
+
+        # Step 1: Validate and analyze input
+        validation_result = self.validator.validate(user_input)
+        if not validation_result["valid"]:
+            log.error(f"Validation failed: {validation_result['error']}")
             return {
                 "success": False,
-                "error": str(e),
+                "error": validation_result["error"],
                 "user_input": user_input,
             }
 
+        log.info("Input validation successful")
+
+        # Extract relevant data
+        sanitized_input = validation_result["sanitized"]
+        language = validation_result["language"]
+        entities = validation_result["entities"]
+
+        # Step 2: Inject trending elements
+        trending_elements = self.trending_injector.inject(entities, language)
+        log.info("Trending elements injected")
+
+        # Step 3: Optimize for platforms (custom selections are cached,
+        # so repeated calls reuse one optimizer per platform tuple)
+        if platforms:
+            optimizer = _get_optimizer(tuple(platforms))
+        else:
+            optimizer = self.platform_optimizer
+
+        platform_specifics = optimizer.optimize_for_all_platforms(
+            {"entities": entities, "language": language}
+        )
+        log.info("Platform optimization completed")
+
+        return {
+            "success": True,
+            "sanitized_input": sanitized_input,
+            "language": language,
+            "entities": entities,
+            "trending_elements": trending_elements,
+            "platform_specifics": platform_specifics,
+        }
+
+    def _assemble_result(
+        self, user_input: str, prepared: Dict, ai_result: Dict
+    ) -> PromptResult:
+        """
+        Structure the AI result into a lazily formatted PromptResult.
+
+        Args:
+            user_input: Original user input
+            prepared: Output of _prepare_generation
+            ai_result: Raw result from Groq client
+
+        Returns:
+            PromptResult with on-demand markdown/telegram outputs
+        """
+        trending_elements = prepared["trending_elements"]
+        platform_specifics = prepared["platform_specifics"]
+        language = prepared["language"]
+
+        # Step 5: Parse and structure the result
+        # For now, we'll use a simple structure based on the AI response
+        # In production, we would parse this more carefully
+        structured_result = self._structure_result(
+            ai_result, trending_elements, platform_specifics, language
+        )
+
+        # Step 6: Markdown/Telegram formatting is deferred to first
+        # access on the result, so structured-only callers never pay it
+        result = PromptResult(
+            success=True,
+            user_input=user_input,
+            sanitized_input=prepared["sanitized_input"],
+            language=language,
+            entities=prepared["entities"],
+            structured_result=structured_result,
+            platform_specifics=platform_specifics,
+            _formatter=self.formatter,
+        )
+
+        # Store last generated for export functionality
+        self.last_generated = result
+
+        log.info("Prompt generation completed successfully")
+        return result
+
     def _structure_result(
         self,
         ai_result: Dict,
@@ -150,48 +436,52 @@ class PromptEngine:
         # Extract raw response
         raw_response = ai_result.get("raw_response", "")
 
-        # Parse the AI response to extract structured data
-        # This is a simplified parser - in production, we would use more robust parsing
-        master_prompt = self._extract_master_prompt(raw_response)
-        visual_specs = self._extract_visual_specs(raw_response)
-        script = self._extract_script(raw_response)
-        hashtags = self._extract_hashtags(raw_response, trending_elements)
+        # Parse the AI response to extract structured data: one line walk
+        # for the line-oriented sections, one regex pass for the script.
+        # Uppercase the full response once and share it, instead of each
+        # extractor re-doing its own case-insensitive presence checks.
+        raw_upper = raw_response.upper()
+        parsed = self._parse_response(raw_response, raw_upper)
+        script = self._extract_script(raw_response, raw_upper)
+        if parsed["hashtags"]:
+            hashtags = _dedupe_cap(parsed["hashtags"])
+        else:
+            hashtags = trending_elements.get("hashtags", [])[:15]
 
         return {
-            "master_prompt": master_prompt,
-            "visual_specifications": visual_specs,
+            "master_prompt": parsed["master_prompt"],
+            "visual_specifications": parsed["visual_specifications"],
             "script": script,
             "hashtags": hashtags,
             "language": language,
             "raw_response": raw_response,
         }
 
-    def _extract_master_prompt(self, raw_response: str) -> str:
-        """Extract master prompt from AI response."""
-        # Look for the section after "MASTER PROMPT" or similar
-        if "MASTER PROMPT" in raw_response:
-            lines = raw_response.split("\n")
-            in_section = False
-            prompt_lines = []
-
-            for line in lines:
-                if "MASTER PROMPT" in line:
-                    in_section = True
-                    continue
-                if in_section:
-                    if line.strip().startswith("#") or "---" in line:
-                        break
-                    if line.strip():
-                        # Remove quote marks if present
-                        clean_line = line.strip().strip('"')
-                        prompt_lines.append(clean_line)
+    def _parse_response(
+        self, raw_response: str, raw_upper: Optional[str] = None
+    ) -> Dict:
+        """
+        Parse the line-oriented sections of an AI response in one pass.
 
-            return " ".join(prompt_lines)
+        Splits the response once and walks the lines with independent
+        per-section state, instead of each extractor re-splitting and
+        re-scanning the full text.
 
-        return raw_response.split("\n")[0] if raw_response else "N/A"
+        Args:
+            raw_response: Raw AI response text
+            raw_upper: Uppercased raw_response, if the caller already has it
 
-    def _extract_visual_specs(self, raw_response: str) -> Dict:
-        """Extract visual specifications from AI response."""
+        Returns:
+            Dictionary with master_prompt, visual_specifications and
+            hashtags (hashtags may be empty when none were found)
+        """
+        if raw_upper is None:
+            raw_upper = raw_response.upper()
+        has_master = "MASTER PROMPT" in raw_upper
+        has_visual = "VISUAL SPECIFICATIONS" in raw_upper
+        has_hashtags = "HASHTAGS" in raw_upper
+
+        master_lines = []
         specs = {
             "Style": "N/A",
             "Camera": "N/A",
@@ -199,124 +489,219 @@ class PromptEngine:
             "Aspect Ratio": "9:16",
             "Mood": "N/A",
         }
-
-        if "VISUAL SPECIFICATIONS" in raw_response or "Visual Specifications" in raw_response:
-            # Try to parse table format
-            lines = raw_response.split("\n")
-            in_section = False
-
-            for i, line in enumerate(lines):
-                if "VISUAL" in line or "Visual" in line:
-                    in_section = True
-                    continue
-
-                if in_section and "---" in line:
-                    continue
-
-                if in_section and "|" in line and "---" not in line:
-                    # This is a table row
-                    parts = [p.strip() for p in line.split("|") if p.strip()]
-                    if len(parts) >= 2:
-                        key = parts[0]
-                        value = parts[1]
-                        if key in specs:
-                            specs[key] = value
-
-                if in_section and "#" in line and "VISUAL" not in line:
+        hashtag_lines = []
+
+        in_master = master_done = False
+        in_visual = visual_done = False
+        in_hash = hash_done = False
+
+        # Per-line classification stays on C-level str operations: a
+        # MULTILINE alternation classifier benchmarked ~1.6x slower than
+        # these membership/startswith checks on representative responses
+        if has_master or has_visual or has_hashtags:
+            for line in raw_response.splitlines():
+                # Stop scanning the tail once every wanted section closed
+                if (
+                    (master_done or not has_master)
+                    and (visual_done or not has_visual)
+                    and (hash_done or not has_hashtags)
+                ):
                     break
 
-        return specs
-
-    def _extract_script(self, raw_response: str) -> Dict:
-        """Extract script sections from AI response with robust regex."""
-        import re
-        script = {"hook": "N/A", "body": "N/A", "cta": "N/A"}
-
-        # Normalize line endings
-        text = raw_response.replace("\r\n", "\n")
-
-        # Improved regex patterns with fallback attempts
-        # Matches: ## Hook, ## **Hook**, ### Hook, **Hook:, 1. Hook:, Hook:, etc.
-        patterns = {
-            "hook": [
-                # Try 1: Standard format with time range on new line
-                r"(?:^|\n)(?:##\s*\*+|###\s*|\d+\.\s*)?(?:Hook|HOOK)\*+(?:\s*\[.*?\])?\s*\n+(.*?)(?=\n(?:##\s*\*+|###\s*|\d+\.\s*)?(?:Body|BODY|CTA|Cta)\*+|$)",
-                # Try 2: Inline format with colon
-                r"(?:^|\n)(?:##\s*\*+|###\s*|\d+\.\s*)?(?:Hook|HOOK)\*+:\s+(.*?)(?=\n(?:##\s*\*+|###\s*|\d+\.\s*)?(?:Body|BODY|CTA|Cta)\*+|$)",
-            ],
-            "body": [
-                # Try 1: Standard format with time range on new line
-                r"(?:^|\n)(?:##\s*\*+|###\s*|\d+\.\s*)?(?:Body|BODY)\*+(?:\s*\[.*?\])?\s*\n+(.*?)(?=\n(?:##\s*\*+|###\s*|\d+\.\s*)?(?:CTA|Cta|Hook|HOOK)\*+|$)",
-                # Try 2: Inline format with colon
-                r"(?:^|\n)(?:##\s*\*+|###\s*|\d+\.\s*)?(?:Body|BODY)\*+:\s+(.*?)(?=\n(?:##\s*\*+|###\s*|\d+\.\s*)?(?:CTA|Cta|Hook|HOOK)\*+|$)",
-            ],
-            "cta": [
-                # Try 1: Standard format with time range on new line
-                r"(?:^|\n)(?:##\s*\*+|###\s*|\d+\.\s*)?(?:CTA|Cta|Call to Action)\*+(?:\s*\[.*?\])?\s*\n+(.*?)(?=\n(?:##\s*\*+|###\s*|#|---)|$)",
-                # Try 2: Inline format with colon
-                r"(?:^|\n)(?:##\s*\*+|###\s*|\d+\.\s*)?(?:CTA|Cta|Call to Action)\*+:\s+(.*?)(?=\n(?:##\s*\*+|###\s*|#|---)|$)",
-            ],
+                stripped = line.strip()
+                # One upper() on the short stripped line replaces the
+                # per-section dual-case substring checks below
+                upper = stripped.upper()
+
+                if has_master and not master_done:
+                    if not in_master:
+                        in_master = "MASTER PROMPT" in upper
+                    elif stripped.startswith("#") or "---" in stripped:
+                        master_done = True
+                    elif stripped:
+                        # Remove quote marks if present
+                        master_lines.append(stripped.strip('"'))
+
+                if has_visual and not visual_done:
+                    if not in_visual:
+                        in_visual = "VISUAL" in upper
+                    elif "---" not in stripped:
+                        if "|" in stripped:
+                            # This is a table row
+                            parts = [p.strip() for p in stripped.split("|") if p.strip()]
+                            if len(parts) >= 2 and parts[0] in specs:
+                                specs[parts[0]] = parts[1]
+                        if "#" in stripped and "VISUAL" not in upper:
+                            visual_done = True
+
+                if has_hashtags and not hash_done:
+                    if not in_hash:
+                        in_hash = "HASHTAGS" in upper
+                    elif (
+                        stripped.startswith("#")
+                        and not stripped.startswith("# ")
+                        and "#" not in stripped[1:]
+                    ) or "---" in stripped:
+                        hash_done = True
+                    elif stripped:
+                        hashtag_lines.append(stripped)
+
+        if has_master:
+            master_prompt = " ".join(master_lines)
+        elif raw_response:
+            # First line via find + slice; split("\n") would copy every
+            # line of the response just to take the first
+            newline = raw_response.find("\n")
+            master_prompt = raw_response if newline == -1 else raw_response[:newline]
+        else:
+            master_prompt = "N/A"
+
+        # Pure str.split tokenization keeps this off the regex engine;
+        # trailing punctuation is trimmed so "#fyp!" yields "fyp"
+        hashtags = [
+            tag
+            for line in hashtag_lines
+            for word in line.split()
+            if word.startswith("#") and (tag := word[1:].rstrip(",.!?"))
+        ]
+
+        return {
+            "master_prompt": master_prompt,
+            "visual_specifications": specs,
+            "hashtags": hashtags,
         }
 
-        for section, pattern_list in patterns.items():
-            content = "N/A"
-            for pattern in pattern_list:
-                match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    captured = match.group(1).strip()
-                    # Clean up quotes, asterisks, colons if present
-                    cleaned = captured.strip('"').strip("'").strip("*").strip("-").lstrip(':').strip()
-                    if cleaned and cleaned != "N/A":
-                        content = cleaned
-                        log.info(f"Extracted {section}: {content[:30]}...")
-                        break
-            script[section] = content
+    def _extract_master_prompt(self, raw_response: str) -> str:
+        """Extract master prompt from AI response."""
+        return self._parse_response(raw_response)["master_prompt"]
+
+    def _extract_visual_specs(self, raw_response: str) -> Dict:
+        """Extract visual specifications from AI response."""
+        return self._parse_response(raw_response)["visual_specifications"]
+
+    def _extract_script(
+        self, raw_response: str, raw_upper: Optional[str] = None
+    ) -> Dict:
+        """Extract script sections from AI response in one line scan."""
+        if not raw_response:
+            return {"hook": "N/A", "body": "N/A", "cta": "N/A"}
+
+        if raw_upper is None:
+            raw_upper = raw_response.upper()
+        if any(hint in raw_upper for hint in _SCRIPT_HINTS):
+            # The scan is a pure function of the response, so retries
+            # and repeated structuring of the same text are memoized
+            hook, body, cta = self._scan_script_sections(raw_response)
+        else:
+            hook = body = cta = "N/A"
+
+        script = {"hook": hook, "body": body, "cta": cta}
+
+        for section, content in script.items():
             if content == "N/A":
                 log.warning(f"No match found for {section} in AI response")
 
         return script
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _scan_script_sections(raw_response: str) -> tuple:
+        """
+        Scan the response lines once for script sections (memoized).
+
+        Args:
+            raw_response: Raw AI response text
+
+        Returns:
+            (hook, body, cta) contents, each "N/A" when absent
+        """
+        # One linear walk with a dispatch table: each line is either
+        # a section header (switch buffers), a structural break, or
+        # content for the currently open section
+        buffers = {"hook": [], "body": [], "cta": []}
+        current = None
+        for line in raw_response.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            header = _match_script_header(stripped)
+            if header is not None:
+                section, inline = header
+                if buffers[section]:
+                    current = None  # first occurrence wins
+                else:
+                    current = section
+                    if inline:
+                        buffers[section].append(inline)
+            elif stripped.startswith("#") or stripped.startswith("---"):
+                current = None
+            elif current is not None:
+                buffers[current].append(stripped)
+
+        sections = []
+        for section in ("hook", "body", "cta"):
+            captured = "\n".join(buffers[section])
+            # One strip call with the full character set instead of
+            # five chained per-character passes
+            cleaned = captured.strip("\"'*- \t").lstrip(":").strip()
+            if cleaned and cleaned != "N/A":
+                sections.append(cleaned)
+                log.info(f"Extracted {section}: {cleaned[:30]}...")
+            else:
+                sections.append("N/A")
+        return tuple(sections)
+
     def _extract_hashtags(self, raw_response: str, trending_elements: Dict) -> list:
         """Extract hashtags from AI response or trending elements."""
-        # First try to extract from response
-        if "HASHTAGS" in raw_response or "Hashtags" in raw_response:
-            lines = raw_response.split("\n")
-            in_section = False
-            hashtag_lines = []
-
-            for line in lines:
-                if "HASHTAGS" in line or "Hashtags" in line:
-                    in_section = True
-                    continue
-
-                if in_section:
-                    # Check for next section header (must be # HEADER format)
-                    if (line.strip().startswith("#") and 
-                        not line.strip().startswith("# ") and 
-                        "#" not in line.strip()[1:]): # Simple heuristic: headers usually don't have multiple # inside
-                        break
-                    
-                    # Also check for --- separator
-                    if "---" in line:
-                        break
-
-                    if line.strip():
-                        hashtag_lines.append(line.strip())
-
-            if hashtag_lines:
-                # Parse hashtags from the collected lines
-                hashtags = []
-                for line in hashtag_lines:
-                    # Extract words starting with #
-                    words = line.split()
-                    hashtags.extend([w.replace("#", "") for w in words if w.startswith("#")])
-
-                if hashtags:
-                    return hashtags
-
+        # No '#' anywhere means no hashtag section; skip the parse
+        if "#" in raw_response:
+            hashtags = self._parse_response(raw_response)["hashtags"]
+            if hashtags:
+                return _dedupe_cap(hashtags)
         # Fallback to trending elements
         return trending_elements.get("hashtags", [])[:15]
 
+    def extract_hashtags_batch(self, raws: list) -> list:
+        """
+        Extract hashtag tokens from several responses in one regex pass.
+
+        Joins the responses with a record separator and runs a single
+        finditer over the buffer, amortizing the per-call regex setup
+        across the batch. Unlike _extract_hashtags this scans
+        hash-prefixed words anywhere in each response and applies no
+        trending fallback.
+
+        Args:
+            raws: Raw AI response texts
+
+        Returns:
+            One deduplicated, capped tag list per input, in order
+        """
+        if not raws:
+            return []
+
+        # Segment end offsets inside the joined buffer; \x1e is not a
+        # word character, so no match can cross a boundary
+        ends = []
+        position = 0
+        for raw in raws:
+            position += len(raw)
+            ends.append(position)
+            position += 1  # separator
+
+        results = [[] for _ in raws]
+        index = 0
+        for match in _HASHTAG_RE.finditer("\x1e".join(raws)):
+            while match.start() >= ends[index]:
+                index += 1
+            results[index].append(match.group(1))
+
+        return [_dedupe_cap(tags) for tags in results]
+
+    async def aclose(self) -> None:
+        """Release the Groq client's pooled HTTP connections."""
+        await self.groq_client.aclose()
+
     def export_last_generated(self, format: str = "md") -> Optional[str]:
         """
         Export the last generated prompt to file.
@@ -333,9 +718,13 @@ class PromptEngine:
 
         try:
             if format == "md":
-                filepath = self.formatter.save_markdown(self.last_generated["markdown"])
+                filepath = self.formatter.save_markdown(
+                    self.last_generated.markdown_output
+                )
             elif format == "json":
-                filepath = self.formatter.save_json(self.last_generated["structured"])
+                filepath = self.formatter.save_json(
+                    self.last_generated.structured_result
+                )
             else:
                 log.error(f"Unsupported format: {format}")
                 return None
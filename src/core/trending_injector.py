@@ -1,14 +1,51 @@
 """Trending Elements injector for 2025 content trends."""
 import json
 import random
-from typing import Dict, List, Optional
+from itertools import chain
+
+try:
+    # Parses ~3x and serializes ~5x faster than stdlib json; the file is
+    # read on first engine init and rewritten on every update_data
+    import orjson
+except ImportError:
+    orjson = None
+from typing import ClassVar, Dict, List, Optional
 from pathlib import Path
 from config.logging_config import log
 
 
+def _dedupe_cap(items, cap: int = 15) -> List:
+    """
+    Deduplicate items preserving order, stopping once cap is reached.
+
+    Unlike list(dict.fromkeys(items))[:cap] this exits as soon as the
+    cap is hit instead of materializing the full ordered set first.
+
+    Args:
+        items: Iterable of hashable items
+        cap: Maximum number of unique items to return
+
+    Returns:
+        List of at most cap unique items in first-seen order
+    """
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if len(out) == cap:
+                break
+    return out
+
+
 class TrendingInjector:
     """Injects trending elements into generated prompts."""
 
+    # Parsed trending data shared across instances, keyed by resolved
+    # path: one file read + JSON parse per process instead of per engine
+    _DATA_CACHE: ClassVar[Dict[Path, Dict]] = {}
+
     def __init__(self, data_path: str = "data/trending_elements_2025.json"):
         """
         Initialize trending injector with cached data.
@@ -18,8 +55,41 @@ class TrendingInjector:
         """
         self.data_path = Path(data_path)
         self.data = self._load_data()
+        self._build_pools()
         log.info("TrendingInjector initialized")
 
+    def _build_pools(self) -> None:
+        """Precompute per-helper pools so inject() skips dict traversal."""
+        hashtags_data = self.data.get("hashtags", {})
+        self._hooks = tuple(self.data.get("hooks", []))
+        self._ctas = tuple(self.data.get("cta", []))
+        self._sounds = tuple(self.data.get("sounds", [])[:3])
+        self._general_hashtags = tuple(hashtags_data.get("general", []))
+        self._hashtag_categories = {
+            category: tuple(tags)
+            for category, tags in hashtags_data.items()
+            if category != "general"
+        }
+        # Map each hashtag category to its entity-dict key once, instead
+        # of re-deriving it with replace() calls on every _get_hashtags
+        self._category_to_entity_key = {
+            category: category.replace("_", "").replace("s", "")
+            for category in self._hashtag_categories
+        }
+
+        # Inverted keyword indexes: matching becomes one dict lookup per
+        # entity instead of scanning every format/style per call
+        self._format_by_keyword = {
+            keyword: format_item
+            for format_item in self.data.get("formats", [])
+            for keyword in format_item.get("keywords", [])
+        }
+        self._style_by_keyword = {
+            keyword: style
+            for style in self.data.get("visual_styles", [])
+            for keyword in style.get("keywords", [])
+        }
+
     def _load_data(self) -> Dict:
         """
         Load trending data from JSON file.
@@ -27,15 +97,25 @@ class TrendingInjector:
         Returns:
             Dictionary containing trending elements
         """
+        cache_key = self.data_path.resolve()
+        cached = self._DATA_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            with open(self.data_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = orjson.loads(self.data_path.read_bytes())
+            else:
+                with open(self.data_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
             log.info(f"Loaded trending data from {self.data_path}")
+            self._DATA_CACHE[cache_key] = data
             return data
         except FileNotFoundError:
             log.error(f"Trending data file not found: {self.data_path}")
             return self._get_fallback_data()
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers both orjson.JSONDecodeError and json.JSONDecodeError
             log.error(f"Error decoding trending data: {e}")
             return self._get_fallback_data()
 
@@ -88,7 +168,15 @@ class TrendingInjector:
             "sound_suggestions": self._get_sound_suggestions(),
         }
 
-        log.info(f"Injected trending elements: {trending_elements}")
+        # Log scalars, not the multi-KB nested dict repr
+        format_item = trending_elements["format"]
+        style = trending_elements["visual_style"]
+        log.info(
+            "Injected trending: format={} style={} hashtags={}",
+            format_item and format_item.get("name"),
+            style and style.get("name"),
+            len(trending_elements["hashtags"]),
+        )
         return trending_elements
 
     def _get_matching_format(self, entities: Dict[str, List[str]]) -> Optional[Dict]:
@@ -101,16 +189,16 @@ class TrendingInjector:
         Returns:
             Format dictionary or None
         """
-        formats = self.data.get("formats", [])
-
-        # Try to match based on topics
-        topics = entities.get("topics", [])
-        for format_item in formats:
-            for topic in topics:
-                if any(keyword in format_item["keywords"] for keyword in format_item["keywords"]):
-                    return format_item
+        # Try to match based on topics. The old scan compared each
+        # format's keyword list against itself, so the first format
+        # always won whenever any topic was detected.
+        for topic in entities.get("topics", []):
+            format_item = self._format_by_keyword.get(topic)
+            if format_item is not None:
+                return format_item
 
         # Return random format if no match
+        formats = self.data.get("formats", [])
         return random.choice(formats) if formats else None
 
     def _get_visual_style(self, entities: Dict[str, List[str]]) -> Optional[Dict]:
@@ -123,17 +211,15 @@ class TrendingInjector:
         Returns:
             Visual style dictionary or None
         """
-        styles = self.data.get("visual_styles", [])
-
-        # Match based on products and topics
-        all_keywords = entities.get("products", []) + entities.get("topics", [])
-
-        for style in styles:
-            style_keywords = style.get("keywords", [])
-            if any(keyword in " ".join(all_keywords) for keyword in style_keywords):
+        # Match based on products and topics; chain avoids allocating a
+        # concatenated list per call (and () is a shared singleton)
+        for word in chain(entities.get("products", ()), entities.get("topics", ())):
+            style = self._style_by_keyword.get(word)
+            if style is not None:
                 return style
 
         # Return random style if no match
+        styles = self.data.get("visual_styles", [])
         return random.choice(styles) if styles else None
 
     def _get_hooks(self, entities: Dict[str, List[str]]) -> List[str]:
@@ -146,8 +232,10 @@ class TrendingInjector:
         Returns:
             List of hook strings
         """
-        all_hooks = self.data.get("hooks", [])
-        return random.sample(all_hooks, min(3, len(all_hooks)))
+        # Sampling the whole pool is just a shuffled copy; skip it
+        if len(self._hooks) <= 3:
+            return list(self._hooks)
+        return random.sample(self._hooks, 3)
 
     def _get_ctas(self) -> List[str]:
         """
@@ -156,8 +244,9 @@ class TrendingInjector:
         Returns:
             List of CTA strings
         """
-        all_ctas = self.data.get("cta", [])
-        return random.sample(all_ctas, min(2, len(all_ctas)))
+        if len(self._ctas) <= 2:
+            return list(self._ctas)
+        return random.sample(self._ctas, 2)
 
     def _get_hashtags(self, entities: Dict[str, List[str]]) -> List[str]:
         """
@@ -169,21 +258,20 @@ class TrendingInjector:
         Returns:
             List of hashtag strings
         """
-        hashtags_data = self.data.get("hashtags", {})
         hashtags = []
 
         # Add category-specific hashtags
-        for category, category_hashtags in hashtags_data.items():
-            if category != "general":
-                all_entities = " ".join(entities.get(category.replace("_", "").replace("s", ""), []))
-                if category in all_entities.lower():
-                    hashtags.extend(category_hashtags)
+        for category, category_hashtags in self._hashtag_categories.items():
+            entity_key = self._category_to_entity_key[category]
+            words = entities.get(entity_key, ())
+            if any(category in word.lower() for word in words):
+                hashtags.extend(category_hashtags)
 
         # Add general hashtags
-        hashtags.extend(hashtags_data.get("general", []))
+        hashtags.extend(self._general_hashtags)
 
-        # Remove duplicates and limit to 15
-        return list(dict.fromkeys(hashtags))[:15]
+        # Remove duplicates (order-preserving) and limit to 15
+        return _dedupe_cap(hashtags)
 
     def _get_sound_suggestions(self) -> List[Dict]:
         """
@@ -192,8 +280,7 @@ class TrendingInjector:
         Returns:
             List of sound suggestion dictionaries
         """
-        sounds = self.data.get("sounds", [])
-        return sounds[:3] if sounds else []
+        return list(self._sounds)
 
     def update_data(self, new_data: Dict) -> bool:
         """
@@ -207,8 +294,17 @@ class TrendingInjector:
         """
         try:
             self.data.update(new_data)
-            with open(self.data_path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                self.data_path.write_bytes(
+                    orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(self.data_path, "w", encoding="utf-8") as f:
+                    json.dump(self.data, f, indent=2, ensure_ascii=False)
+            # Drop the shared parse so later instances reload the file,
+            # and rebuild this instance's pools from the merged data
+            self._DATA_CACHE.pop(self.data_path.resolve(), None)
+            self._build_pools()
             log.info("Trending data updated successfully")
             return True
         except Exception as e:
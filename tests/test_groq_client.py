@@ -0,0 +1,69 @@
+"""Unit tests for the Groq client wrapper."""
+import pytest
+from unittest.mock import Mock
+from src.core.groq_client import GroqClient
+
+
+def _chunk(text):
+    """Build a streaming chunk stand-in with the given delta content."""
+    chunk = Mock()
+    chunk.choices = [Mock(delta=Mock(content=text))]
+    return chunk
+
+
+def _response(text):
+    """Build a completion response stand-in with the given content."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content=text))]
+    return response
+
+
+class TestGroqClient:
+    """Test cases for GroqClient streaming and batch entry points."""
+
+    @pytest.fixture(scope="module")
+    def client(self):
+        """Create one client shared across this module (no network use)."""
+        return GroqClient()
+
+    def test_generate_stream_yields_chunks(self, client):
+        """Test streaming yields non-empty deltas in order."""
+        client._create = Mock(
+            return_value=iter([_chunk("Hel"), _chunk(None), _chunk("lo")])
+        )
+
+        parts = list(client.generate_stream("hi"))
+
+        assert parts == ["Hel", "lo"]
+        assert client._create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_agenerate_stream_yields_chunks(self, client):
+        """Test async streaming yields non-empty deltas in order."""
+
+        async def aiter():
+            for text in ("a", None, "b"):
+                yield _chunk(text)
+
+        async def fake_acreate(**kwargs):
+            assert kwargs["stream"] is True
+            return aiter()
+
+        client._acreate = fake_acreate
+
+        parts = [chunk async for chunk in client.agenerate_stream("hi")]
+
+        assert parts == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_agenerate_many_preserves_order(self, client):
+        """Test concurrent batch generation returns results in input order."""
+
+        async def fake_acreate(**kwargs):
+            return _response(kwargs["messages"][-1]["content"].upper())
+
+        client._acreate = fake_acreate
+
+        results = await client.agenerate_many(["abc", "def"])
+
+        assert results == ["ABC", "DEF"]
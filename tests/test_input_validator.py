@@ -87,3 +87,32 @@ class TestInputValidator:
         # Should return empty lists, not None
         assert isinstance(entities["products"], list)
         assert isinstance(entities["topics"], list)
+
+    def test_validate_many_single(self, validator):
+        """Test batch validation takes the in-process path for one input."""
+        results = validator.validate_many(["Review skincare and makeup products"])
+
+        assert len(results) == 1
+        assert results[0]["valid"] is True
+
+    def test_validate_many_parallel(self, validator):
+        """Test batch validation across worker processes keeps input order."""
+        texts = [
+            "Review skincare and makeup products",
+            "Tutorial how to apply makeup",
+            "tes",
+        ]
+
+        results = validator.validate_many(texts, workers=2)
+
+        assert [r["valid"] for r in results] == [True, True, False]
+        assert "tutorial" in results[1]["entities"]["topics"]
+
+    @pytest.mark.asyncio
+    async def test_avalidate_many(self, validator):
+        """Test async batch validation preserves input order."""
+        texts = ["Review skincare and makeup products", "tes"]
+
+        results = await validator.avalidate_many(texts)
+
+        assert [r["valid"] for r in results] == [True, False]
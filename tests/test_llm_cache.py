@@ -0,0 +1,62 @@
+"""Unit tests for the LLM response cache."""
+from src.core.llm_cache import MemoryCache, make_key
+
+
+class TestMakeKey:
+    """Test cases for the cache key builder."""
+
+    def test_deterministic(self):
+        """Test identical requests produce identical keys."""
+        messages = [{"role": "user", "content": "hi"}]
+
+        assert make_key("model", messages, 0.7, 100) == make_key(
+            "model", messages, 0.7, 100
+        )
+
+    def test_sensitive_to_parameters(self):
+        """Test any differing request parameter changes the key."""
+        messages = [{"role": "user", "content": "hi"}]
+        base = make_key("model", messages, 0.7, 100)
+
+        assert make_key("other", messages, 0.7, 100) != base
+        assert make_key("model", messages, 0.0, 100) != base
+        assert make_key("model", messages, 0.7, 200) != base
+        assert make_key("model", [{"role": "user", "content": "yo"}], 0.7, 100) != base
+
+
+class TestMemoryCache:
+    """Test cases for the in-process LRU cache."""
+
+    def test_get_set_roundtrip(self):
+        """Test a stored response comes back and counts as a hit."""
+        cache = MemoryCache()
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.stats["hits"] == 1
+
+    def test_miss_returns_none(self):
+        """Test an absent key is a counted miss."""
+        cache = MemoryCache()
+
+        assert cache.get("absent") is None
+        assert cache.stats["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")  # refresh "a" so "b" becomes the oldest
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_ttl_expiry(self):
+        """Test an expired entry is treated as a miss."""
+        cache = MemoryCache()
+        cache.set("key", "value", ttl=0)
+
+        assert cache.get("key") is None
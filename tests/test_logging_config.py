@@ -0,0 +1,51 @@
+"""Unit tests for logging configuration."""
+from datetime import datetime
+
+from config.logging_config import SizeAndTimeRotator
+
+
+class _FakeMessage(str):
+    """Loguru-style message: a string carrying a record dict."""
+
+    def __new__(cls, text, when):
+        message = super().__new__(cls, text)
+        message.record = {"time": when}
+        return message
+
+
+class _FakeFile:
+    """File stand-in exposing only the tell() the rotator uses."""
+
+    def __init__(self, size):
+        self._size = size
+
+    def tell(self):
+        return self._size
+
+
+class TestSizeAndTimeRotator:
+    """Test cases for the size+date log rotator."""
+
+    def test_no_rotation_same_day_under_cap(self):
+        """Test a small file on the same day is not rotated."""
+        rotator = SizeAndTimeRotator(size_limit=100)
+        message = _FakeMessage("x" * 10, datetime(2026, 8, 26, 10, 0))
+
+        assert rotator(message, _FakeFile(0)) is False
+
+    def test_rotates_on_date_change(self):
+        """Test crossing midnight triggers rotation."""
+        rotator = SizeAndTimeRotator(size_limit=100)
+        rotator(_FakeMessage("a", datetime(2026, 8, 26, 23, 59)), _FakeFile(0))
+
+        assert (
+            rotator(_FakeMessage("b", datetime(2026, 8, 27, 0, 0)), _FakeFile(0))
+            is True
+        )
+
+    def test_rotates_on_size_cap(self):
+        """Test exceeding the size cap triggers rotation."""
+        rotator = SizeAndTimeRotator(size_limit=100)
+        message = _FakeMessage("x" * 10, datetime(2026, 8, 26, 10, 0))
+
+        assert rotator(message, _FakeFile(95)) is True
@@ -1,20 +1,25 @@
 """Unit tests for Prompt Engine."""
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
 from src.core.prompt_engine import PromptEngine
 
 
 class TestPromptEngine:
     """Test cases for PromptEngine class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def engine(self):
-        """Create an engine instance for testing."""
+        """Create one engine instance shared across this module's tests."""
         return PromptEngine()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def mock_groq(self):
+        """Prebuilt Groq client mock, reset per test instead of rebuilt."""
+        return Mock()
+
+    @pytest.fixture(scope="session")
     def mock_validation_result(self):
-        """Mock validation result."""
+        """Mock validation result (read-only, built once per session)."""
         return {
             "valid": True,
             "sanitized": "Jualin skincare pagi hari yang bagus buat wajah berminyak",
@@ -28,9 +33,9 @@ class TestPromptEngine:
             "length": 50,
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def mock_groq_result(self):
-        """Mock Groq API result."""
+        """Mock Groq API result (read-only, built once per session)."""
         return {
             "raw_response": """# MASTER PROMPT (Text-to-Video)
 A cinematic morning skincare routine for oily skin
@@ -69,18 +74,46 @@ Follow untuk tips lebih lanjut
         assert engine.formatter is not None
         assert engine.last_generated is None
 
-    @patch.object(PromptEngine, "generate_prompt")
-    def test_generate_prompt_success(self, mock_generate, engine):
-        """Test successful prompt generation."""
-        mock_generate.return_value = {
-            "success": True,
-            "user_input": "Test input",
-            "markdown_output": "Test markdown",
-        }
+    def test_generate_prompt_success(self, engine, mock_groq, mock_groq_result):
+        """Test successful prompt generation with a mocked Groq client."""
+        mock_groq.reset_mock()
+        mock_groq.generate_prompt_from_input.return_value = mock_groq_result
 
-        result = engine.generate_prompt("Test input")
+        original_client = engine.groq_client
+        engine.groq_client = mock_groq
+        try:
+            result = engine.generate_prompt(
+                "Jualin skincare pagi hari yang bagus buat wajah berminyak"
+            )
+        finally:
+            engine.groq_client = original_client
 
         assert result["success"] is True
+        mock_groq.generate_prompt_from_input.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_agenerate_prompt_many(self, engine, mock_groq_result):
+        """Test concurrent batch generation returns results in order."""
+        mock_client = Mock()
+        mock_client.agenerate_prompt_from_input = AsyncMock(
+            return_value=mock_groq_result
+        )
+
+        original_client = engine.groq_client
+        engine.groq_client = mock_client
+        try:
+            results = await engine.agenerate_prompt_many(
+                [
+                    "Review skincare untuk remaja dengan kulit berminyak",
+                    "Tutorial makeup natural buat pemula",
+                ],
+                concurrency=2,
+            )
+        finally:
+            engine.groq_client = original_client
+
+        assert len(results) == 2
+        assert all(result["success"] for result in results)
 
     def test_extract_master_prompt(self, engine):
         """Test master prompt extraction from AI response."""
@@ -136,8 +169,50 @@ Test CTA"""
         assert len(hashtags) > 0
         assert "skincare" in hashtags
 
+    def test_extract_hashtags_batch(self, engine):
+        """Test batch extraction splits matches back to their inputs."""
+        raws = [
+            "# HASHTAGS\n#skincare #fyp",
+            "",
+            "no tags here",
+            "#start middle #end",
+        ]
+
+        assert engine.extract_hashtags_batch(raws) == [
+            ["skincare", "fyp"],
+            [],
+            [],
+            ["start", "end"],
+        ]
+
+    def test_extract_hashtags_batch_empty(self, engine):
+        """Test batch extraction with no inputs."""
+        assert engine.extract_hashtags_batch([]) == []
+
+    def test_extract_hashtags_batch_boundaries(self, engine):
+        """Test tags touching segment boundaries stay with their input."""
+        raws = ["#first", "#second", "#third"]
+
+        assert engine.extract_hashtags_batch(raws) == [
+            ["first"],
+            ["second"],
+            ["third"],
+        ]
+
+    def test_extract_hashtags_batch_dedupes_and_caps(self, engine):
+        """Test per-input dedupe and the 15-tag cap."""
+        raws = [" ".join(f"#tag{i}" for i in range(20)) + " #tag0"]
+
+        tags = engine.extract_hashtags_batch(raws)[0]
+
+        assert len(tags) == 15
+        assert tags[0] == "tag0"
+        assert len(set(tags)) == 15
+
     def test_export_last_generated_none(self, engine):
         """Test export when no prompt has been generated."""
+        # The engine is module-scoped; make the precondition explicit
+        engine.last_generated = None
         result = engine.export_last_generated()
 
         assert result is None
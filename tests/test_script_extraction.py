@@ -3,17 +3,9 @@ import pytest
 from src.core.prompt_engine import PromptEngine
 
 
-class TestScriptExtractionPatterns:
-    """Test various AI output formats for script extraction."""
-
-    @pytest.fixture
-    def engine(self):
-        """Create PromptEngine instance for testing."""
-        return PromptEngine()
-
-    def test_standard_format(self, engine):
-        """Test standard ## Hook format with newlines."""
-        raw = """## Hook [0:00-0:03]
+# Raw response variants, built once at import and shared by the
+# parametrized test below
+STANDARD_RAW = """## Hook [0:00-0:03]
 Test hook
 
 ## Body [0:03-0:45]
@@ -22,14 +14,7 @@ Test body
 ## CTA [0:45-0:60]
 Test CTA"""
 
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook"
-        assert script["body"] == "Test body"
-        assert script["cta"] == "Test CTA"
-
-    def test_bold_section_names(self, engine):
-        """Test ## **Hook** format (AI common output)."""
-        raw = """## **Hook** [0:00-0:03]
+BOLD_RAW = """## **Hook** [0:00-0:03]
 Test hook
 
 ## **Body** [0:03-0:45]
@@ -38,32 +23,96 @@ Test body
 ## **CTA** [0:45-0:60]
 Test CTA"""
 
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook"
-        assert script["body"] == "Test body"
-        assert script["cta"] == "Test CTA"
-
-    def test_inline_content(self, engine):
-        """Test hook/body/cta content on same line as header."""
-        raw = """## Hook: Test hook
+INLINE_RAW = """## Hook: Test hook
 ## Body: Test body
 ## CTA: Test CTA"""
 
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook"
-        assert script["body"] == "Test body"
-        assert script["cta"] == "Test CTA"
-
-    def test_numbered_list_format(self, engine):
-        """Test numbered list format (1. Hook, 2. Body, etc.)."""
-        raw = """1. Hook: Test hook
+NUMBERED_RAW = """1. Hook: Test hook
 2. Body: Test body
 3. CTA: Test CTA"""
 
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook"
-        assert script["body"] == "Test body"
-        assert script["cta"] == "Test CTA"
+TRIPLE_BOLD_RAW = """## ***Hook*** [0:00-0:03]
+Test hook
+
+## ***Body*** [0:03-0:45]
+Test body
+
+## ***CTA*** [0:45-0:60]
+Test CTA"""
+
+MIXED_RAW = """## **Hook** [0:00-0:03]
+Test hook
+
+### Body [0:03-0:45]
+Test body
+
+1. CTA: Test CTA"""
+
+QUOTED_RAW = """## Hook [0:00-0:03]
+"Test hook in quotes"
+
+## Body [0:03-0:45]
+'Test body in single quotes'
+
+## CTA [0:45-0:60]
+Test CTA without quotes"""
+
+
+class TestScriptExtractionPatterns:
+    """Test various AI output formats for script extraction."""
+
+    @pytest.fixture(scope="module")
+    def engine(self):
+        """Create one PromptEngine instance shared across this module."""
+        return PromptEngine()
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            pytest.param(
+                STANDARD_RAW,
+                {"hook": "Test hook", "body": "Test body", "cta": "Test CTA"},
+                id="standard",
+            ),
+            pytest.param(
+                BOLD_RAW,
+                {"hook": "Test hook", "body": "Test body", "cta": "Test CTA"},
+                id="bold",
+            ),
+            pytest.param(
+                INLINE_RAW,
+                {"hook": "Test hook", "body": "Test body", "cta": "Test CTA"},
+                id="inline",
+            ),
+            pytest.param(
+                NUMBERED_RAW,
+                {"hook": "Test hook", "body": "Test body", "cta": "Test CTA"},
+                id="numbered",
+            ),
+            pytest.param(
+                TRIPLE_BOLD_RAW,
+                {"hook": "Test hook", "body": "Test body", "cta": "Test CTA"},
+                id="triple-bold",
+            ),
+            pytest.param(
+                MIXED_RAW,
+                {"hook": "Test hook", "body": "Test body", "cta": "Test CTA"},
+                id="mixed",
+            ),
+            pytest.param(
+                QUOTED_RAW,
+                {
+                    "hook": "Test hook in quotes",
+                    "body": "Test body in single quotes",
+                    "cta": "Test CTA without quotes",
+                },
+                id="quoted",
+            ),
+        ],
+    )
+    def test_script_extraction(self, engine, raw, expected):
+        """Test header variants that should all parse to the same script."""
+        assert engine._extract_script(raw) == expected
 
     def test_special_characters(self, engine):
         """Test script with Markdown special characters."""
@@ -97,37 +146,6 @@ Test body"""
         assert script["body"] == "Test body"
         assert script["cta"] == "N/A"
 
-    def test_triple_bold_format(self, engine):
-        """Test ***Hook*** format (AI sometimes uses 3 asterisks)."""
-        raw = """## ***Hook*** [0:00-0:03]
-Test hook
-
-## ***Body*** [0:03-0:45]
-Test body
-
-## ***CTA*** [0:45-0:60]
-Test CTA"""
-
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook"
-        assert script["body"] == "Test body"
-        assert script["cta"] == "Test CTA"
-
-    def test_mixed_formatting(self, engine):
-        """Test mix of different header formats in same response."""
-        raw = """## **Hook** [0:00-0:03]
-Test hook
-
-### Body [0:03-0:45]
-Test body
-
-1. CTA: Test CTA"""
-
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook"
-        assert script["body"] == "Test body"
-        assert script["cta"] == "Test CTA"
-
     def test_empty_response(self, engine):
         """Test empty AI response."""
         raw = ""
@@ -136,19 +154,3 @@ Test body
         assert script["hook"] == "N/A"
         assert script["body"] == "N/A"
         assert script["cta"] == "N/A"
-
-    def test_content_with_quotes(self, engine):
-        """Test content wrapped in quotes."""
-        raw = """## Hook [0:00-0:03]
-"Test hook in quotes"
-
-## Body [0:03-0:45]
-'Test body in single quotes'
-
-## CTA [0:45-0:60]
-Test CTA without quotes"""
-
-        script = engine._extract_script(raw)
-        assert script["hook"] == "Test hook in quotes"
-        assert script["body"] == "Test body in single quotes"
-        assert script["cta"] == "Test CTA without quotes"